@@ -2,9 +2,17 @@
 Business audit logging for StatusWatch.
 
 Logs critical business events for compliance, security, and analytics.
+
+Audit records are built on the request thread but handed to a background
+flusher (``AuditBatcher``) so file/stream handler I/O stays off the
+critical path of authentication requests.
 """
 
+import atexit
 import logging
+import os
+import queue
+import threading
 from enum import Enum
 from typing import Any
 
@@ -98,11 +106,21 @@ def log_audit_event(
             details={'organization': tenant.name}
         )
     """
+    if not audit_logger.isEnabledFor(logging.INFO):
+        return
+
     # Use details if provided, otherwise fall back to metadata
     event_data = details or metadata or {}
 
-    audit_logger.info(
-        f"Audit: {event.value}",
+    record = audit_logger.makeRecord(
+        audit_logger.name,
+        logging.INFO,
+        __file__,
+        0,
+        "Audit: %s",
+        (event.value,),
+        None,
+        func="log_audit_event",
         extra={
             "audit_event": event.value,
             "audit_category": _get_event_category(event),
@@ -115,6 +133,91 @@ def log_audit_event(
             "audit_success": success,
         },
     )
+    audit_batcher.enqueue(record)
+
+
+class AuditBatcher:
+    """
+    Buffer audit records and flush them to the audit logger in batches.
+
+    Records are drained by a daemon thread once ``batch_size`` records are
+    waiting or ``flush_interval`` seconds have elapsed. The queue is bounded:
+    when the sink falls behind, new records are dropped and counted in
+    ``dropped`` instead of growing the worker's memory without limit.
+
+    The flush thread is started lazily on first use (and restarted after a
+    fork) so pre-forking servers such as gunicorn do not inherit a dead thread.
+    """
+
+    def __init__(
+        self,
+        logger: logging.Logger,
+        *,
+        batch_size: int = 500,
+        flush_interval: float = 0.2,
+        max_queue_size: int = 10_000,
+    ):
+        self.logger = logger
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.dropped = 0
+        self._queue: queue.Queue[logging.LogRecord] = queue.Queue(maxsize=max_queue_size)
+        self._lock = threading.Lock()
+        self._thread: threading.Thread | None = None
+        self._pid: int | None = None
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        """Queue a record for the background flusher (never blocks)."""
+        self._ensure_started()
+        try:
+            self._queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+    def flush_sync(self) -> None:
+        """Drain every pending record on the calling thread."""
+        self._emit(self._drain(block=False))
+
+    def _ensure_started(self) -> None:
+        if self._pid == os.getpid() and self._thread is not None and self._thread.is_alive():
+            return
+        with self._lock:
+            if self._pid == os.getpid() and self._thread is not None and self._thread.is_alive():
+                return
+            self._pid = os.getpid()
+            self._thread = threading.Thread(target=self._run, name="audit-log-flusher", daemon=True)
+            self._thread.start()
+
+    def _run(self) -> None:
+        while True:
+            batch = self._drain(block=True)
+            if batch:
+                self._emit(batch)
+
+    def _drain(self, *, block: bool) -> list[logging.LogRecord]:
+        batch: list[logging.LogRecord] = []
+        if block:
+            try:
+                batch.append(self._queue.get(timeout=self.flush_interval))
+            except queue.Empty:
+                return batch
+        limit = self.batch_size if block else None
+        while limit is None or len(batch) < limit:
+            try:
+                batch.append(self._queue.get_nowait())
+            except queue.Empty:
+                break
+        return batch
+
+    def _emit(self, batch: list[logging.LogRecord]) -> None:
+        # Logger.handle applies the logger's filters and walks the handler hierarchy,
+        # so every handler keeps its own emit behaviour (reopening, rotation, ...).
+        for record in batch:
+            self.logger.handle(record)
+
+
+audit_batcher = AuditBatcher(audit_logger)
+atexit.register(audit_batcher.flush_sync)
 
 
 def _get_event_category(event: AuditEvent) -> str:
@@ -1,4 +1,4 @@
-"""Utilities for keeping log output free of secrets."""
+"""Utilities for log output: request context and keeping secrets out of it."""
 
 from __future__ import annotations
 
@@ -49,3 +49,17 @@ def sanitize_log_value(value: Any) -> Any:
 
     # ErrorDetail and similar types stringify cleanly.
     return value
+
+
+def get_client_ip(request) -> str:
+    """Return the client IP (first X-Forwarded-For hop), parsed once per request."""
+    client_ip: str | None = getattr(request, "_client_ip", None)
+    if client_ip is None:
+        forwarded_for = request.META.get("HTTP_X_FORWARDED_FOR")
+        if forwarded_for:
+            # First IP in the chain is the original client
+            client_ip = str(forwarded_for).split(",")[0].strip()
+        else:
+            client_ip = str(request.META.get("REMOTE_ADDR", "unknown"))
+        request._client_ip = client_ip
+    return client_ip
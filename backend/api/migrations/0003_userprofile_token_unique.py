@@ -0,0 +1,28 @@
+# Generated by Django 5.2.18 on 2026-10-16 22:12
+
+import uuid
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("api", "0002_userprofile_userprof_verified_idx_and_more"),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name="userprofile",
+            name="userprof_token_idx",
+        ),
+        migrations.AlterField(
+            model_name="userprofile",
+            name="email_verification_token",
+            field=models.UUIDField(
+                default=uuid.uuid4,
+                editable=False,
+                help_text="Token sent to user's email for verification",
+                unique=True,
+            ),
+        ),
+    ]
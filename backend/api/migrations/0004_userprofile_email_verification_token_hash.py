@@ -0,0 +1,39 @@
+import hashlib
+
+from django.db import migrations, models
+
+
+def hash_verification_token(token):
+    # Frozen copy of api.models.hash_verification_token as of this migration.
+    return int.from_bytes(hashlib.sha256(token.bytes).digest()[:8], "big", signed=True)
+
+
+def populate_token_hashes(apps, schema_editor):
+    UserProfile = apps.get_model("api", "UserProfile")
+    profiles = list(UserProfile.objects.only("id", "email_verification_token"))
+    for profile in profiles:
+        profile.email_verification_token_hash = hash_verification_token(
+            profile.email_verification_token
+        )
+    UserProfile.objects.bulk_update(profiles, ["email_verification_token_hash"], batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("api", "0003_userprofile_token_unique"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="userprofile",
+            name="email_verification_token_hash",
+            field=models.BigIntegerField(
+                db_index=True,
+                editable=False,
+                help_text="64-bit hash of the verification token used for compact index lookups",
+                null=True,
+            ),
+        ),
+        migrations.RunPython(populate_token_hashes, migrations.RunPython.noop),
+    ]
@@ -4,6 +4,7 @@ API models for StatusWatch.
 Includes UserProfile for email verification and user metadata.
 """
 
+import hashlib
 import uuid
 from datetime import timedelta
 
@@ -14,6 +15,11 @@ from django.utils import timezone
 User = get_user_model()
 
 
+def hash_verification_token(token: uuid.UUID) -> int:
+    """Return a signed 64-bit lookup hash (first 8 bytes of SHA-256) of a token."""
+    return int.from_bytes(hashlib.sha256(token.bytes).digest()[:8], "big", signed=True)
+
+
 class UserProfile(models.Model):
     """
     Extended user profile with email verification support.
@@ -29,7 +35,17 @@ class UserProfile(models.Model):
     )
 
     email_verification_token = models.UUIDField(
-        default=uuid.uuid4, editable=False, help_text="Token sent to user's email for verification"
+        default=uuid.uuid4,
+        editable=False,
+        unique=True,
+        help_text="Token sent to user's email for verification",
+    )
+
+    email_verification_token_hash = models.BigIntegerField(
+        null=True,
+        editable=False,
+        db_index=True,
+        help_text="64-bit hash of the verification token used for compact index lookups",
     )
 
     email_verification_sent_at: models.DateTimeField | None = models.DateTimeField(
@@ -45,7 +61,6 @@ class UserProfile(models.Model):
         verbose_name_plural = "User Profiles"
         indexes = [
             models.Index(fields=["email_verified"], name="userprof_verified_idx"),
-            models.Index(fields=["email_verification_token"], name="userprof_token_idx"),
             models.Index(fields=["created_at"], name="userprof_created_idx"),
             models.Index(fields=["email_verified", "-created_at"], name="userprof_ver_created_idx"),
         ]
@@ -53,6 +68,15 @@ class UserProfile(models.Model):
     def __str__(self):
         return f"Profile for {self.user.email}"
 
+    def save(self, *args, **kwargs):
+        token_hash = hash_verification_token(self.email_verification_token)
+        if self.email_verification_token_hash != token_hash:
+            self.email_verification_token_hash = token_hash
+            update_fields = kwargs.get("update_fields")
+            if update_fields is not None:
+                kwargs["update_fields"] = {*update_fields, "email_verification_token_hash"}
+        super().save(*args, **kwargs)
+
     def is_verification_token_expired(self, hours=48):
         """
         Check if verification token has expired.
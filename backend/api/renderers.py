@@ -0,0 +1,29 @@
+"""
+JSON renderer for the REST API.
+
+orjson does the encoding; ``default`` only sees the types orjson cannot encode
+natively and keeps DRF's JSONEncoder output for them.
+"""
+
+import datetime
+from typing import Any
+
+from drf_orjson_renderer.renderers import ORJSONRenderer
+
+
+class StatusWatchJSONRenderer(ORJSONRenderer):
+    """ORJSONRenderer that matches DRF for timedelta and rejects unknown types."""
+
+    @staticmethod
+    def default(obj: Any) -> Any:
+        if isinstance(obj, datetime.timedelta):
+            # DRF's JSONEncoder renders durations as a seconds string.
+            return str(obj.total_seconds())
+        if isinstance(obj, bytes):
+            return obj.decode()
+        converted = ORJSONRenderer.default(obj)
+        if converted is None:
+            # The base class returns None for anything it does not know, which orjson
+            # would silently render as null.
+            raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+        return converted
@@ -1,6 +1,66 @@
+import logging
+
 from celery import shared_task
+from django.contrib.auth import get_user_model
+from django.utils import timezone
+from django_tenants.utils import schema_context
+from rest_framework_simplejwt.settings import api_settings as jwt_api_settings
+from rest_framework_simplejwt.utils import datetime_from_epoch
+
+logger = logging.getLogger(__name__)
 
 
 @shared_task
 def ping(name="world"):
     return f"pong {name}"
+
+
+@shared_task(bind=True, max_retries=3, default_retry_delay=30)
+def send_verification_email_task(self, user_id, verification_token, tenant_schema):
+    """Send the verification email outside the request/response cycle."""
+    from api import utils
+
+    with schema_context(tenant_schema):
+        user = get_user_model().objects.filter(pk=user_id).first()
+        if user is None:
+            logger.warning(
+                "User %s no longer exists in tenant %s; skipping verification email",
+                user_id,
+                tenant_schema,
+            )
+            return False
+
+        if not utils.send_verification_email(user, verification_token):
+            raise self.retry()
+    return True
+
+
+@shared_task(bind=True, max_retries=3, default_retry_delay=10)
+def blacklist_refresh_token_task(self, jti, user_id, exp, tenant_schema):
+    """Persist a logout's blacklist entry, by JTI, to the tenant's blacklist tables."""
+    from rest_framework_simplejwt.token_blacklist.models import (
+        BlacklistedToken,
+        OutstandingToken,
+    )
+
+    with schema_context(tenant_schema):
+        try:
+            user = (
+                get_user_model().objects.filter(**{jwt_api_settings.USER_ID_FIELD: user_id}).first()
+                if user_id is not None
+                else None
+            )
+            # The row normally exists from login; the fallback keeps no token text.
+            token, _ = OutstandingToken.objects.get_or_create(
+                jti=jti,
+                defaults={
+                    "user": user,
+                    "created_at": timezone.now(),
+                    "token": "",
+                    "expires_at": datetime_from_epoch(exp),
+                },
+            )
+            BlacklistedToken.objects.get_or_create(token=token)
+        except Exception as exc:
+            raise self.retry(exc=exc) from exc
+    return True
@@ -12,7 +12,14 @@ FK validation errors in OutstandingToken creation.
 
 import logging
 
-from modules.accounts.authentication import TenantAuthService, TokenRefreshError
+import jwt
+from django.conf import settings
+from modules.accounts.authentication import (
+    TenantAuthService,
+    TokenRefreshError,
+    acquire_refresh_lock,
+    release_refresh_lock,
+)
 from rest_framework import status
 from rest_framework.response import Response
 from rest_framework.views import APIView
@@ -28,6 +35,32 @@ RefreshToken = _RefreshToken
 logger = logging.getLogger("api.auth")
 
 
+def _is_structurally_valid(refresh_token) -> bool:
+    """
+    Cheaply reject tokens that can never validate, without touching the database.
+
+    Checks the JWT shape (three segments, decodable header and payload), that the
+    header algorithm matches SIMPLE_JWT["ALGORITHM"], and that exp/iat are numeric.
+    Signature, expiry and blacklist checks are still left to TenantAuthService.
+    """
+    if not isinstance(refresh_token, str) or refresh_token.count(".") != 2:
+        return False
+
+    try:
+        # One unverified parse yields both header and claims.
+        decoded = jwt.api_jwt.decode_complete(refresh_token, options={"verify_signature": False})
+    except jwt.PyJWTError:
+        return False
+
+    header, payload = decoded["header"], decoded["payload"]
+    if header.get("alg") != settings.SIMPLE_JWT.get("ALGORITHM", "HS256"):
+        return False
+
+    return all(
+        isinstance(payload.get(claim), int | float) for claim in ("exp", "iat") if claim in payload
+    )
+
+
 class MultiTenantTokenRefreshView(APIView):
     """
     Token refresh view that works across tenant and public schemas.
@@ -40,6 +73,17 @@ class MultiTenantTokenRefreshView(APIView):
     authentication_classes: list[type] = []  # No authentication required for token refresh
     permission_classes: list[type] = []  # Public endpoint
 
+    def _refresh_in_progress(self, client_ip, user_agent):
+        logger.warning("[TOKEN-REFRESH] Concurrent refresh rejected for IP: %s", client_ip)
+        log_audit_event(
+            AuditEvent.TOKEN_REFRESH,
+            ip_address=client_ip,
+            user_agent=user_agent,
+            success=False,
+            details={"reason": "refresh_in_progress"},
+        )
+        return Response({"error": "Refresh already in progress"}, status=status.HTTP_409_CONFLICT)
+
     def post(self, request):
         """
         Refresh an access token using a valid refresh token.
@@ -58,6 +102,9 @@ class MultiTenantTokenRefreshView(APIView):
                 "access": "<new_access_token>",
                 "refresh": "<new_refresh_token>"  # Only if ROTATE_REFRESH_TOKENS=True
             }
+
+        A second refresh of the same token while the first is still running
+        returns 409 Conflict instead of rotating it twice.
         """
         refresh_token = request.data.get("refresh")
         client_ip = request.META.get("REMOTE_ADDR")
@@ -65,8 +112,7 @@ class MultiTenantTokenRefreshView(APIView):
 
         if not refresh_token:
             logger.warning(
-                f"[TOKEN-REFRESH] Missing refresh token in request from "
-                f"IP: {request.META.get('REMOTE_ADDR')}"
+                "[TOKEN-REFRESH] Missing refresh token in request from IP: %s", client_ip
             )
             log_audit_event(
                 AuditEvent.TOKEN_REFRESH,
@@ -80,10 +126,23 @@ class MultiTenantTokenRefreshView(APIView):
             )
 
         try:
-            with PerformanceMonitor("token_refresh", threshold_ms=250):
-                result = TenantAuthService.refresh_tokens(refresh_token, token_class=RefreshToken)
+            if not _is_structurally_valid(refresh_token):
+                raise TokenRefreshError("Token is invalid")
 
-            logger.info(f"[TOKEN-REFRESH] ✓ Token refresh successful for user_id: {result.user_id}")
+            with PerformanceMonitor("token_refresh", threshold_ms=250):
+                # Verify the signature once here and hand the decoded token to the service.
+                token = RefreshToken(refresh_token)
+                jti = token.get("jti")
+                if not acquire_refresh_lock(jti):
+                    return self._refresh_in_progress(client_ip, user_agent)
+                try:
+                    result = TenantAuthService.refresh_tokens(token)
+                finally:
+                    release_refresh_lock(jti)
+
+            logger.info(
+                "[TOKEN-REFRESH] ✓ Token refresh successful for user_id: %s", result.user_id
+            )
 
             log_audit_event(
                 AuditEvent.TOKEN_REFRESH,
@@ -101,7 +160,7 @@ class MultiTenantTokenRefreshView(APIView):
             return Response(result.data, status=status.HTTP_200_OK)
 
         except (TokenRefreshError, TokenError) as e:
-            logger.warning(f"[TOKEN-REFRESH] ✗ Invalid or expired token: {str(e)}")
+            logger.warning("[TOKEN-REFRESH] ✗ Invalid or expired token: %s", e)
             log_audit_event(
                 AuditEvent.TOKEN_REFRESH,
                 ip_address=client_ip,
@@ -112,7 +171,7 @@ class MultiTenantTokenRefreshView(APIView):
             return Response({"error": str(e)}, status=status.HTTP_401_UNAUTHORIZED)
 
         except Exception as e:
-            logger.error(f"[TOKEN-REFRESH] ✗ Unexpected error: {e}", exc_info=True)
+            logger.error("[TOKEN-REFRESH] ✗ Unexpected error: %s", e, exc_info=True)
             log_audit_event(
                 AuditEvent.TOKEN_REFRESH,
                 ip_address=client_ip,
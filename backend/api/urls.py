@@ -3,9 +3,9 @@ from django.urls import path
 from .views import (
     CurrentUserView,
     LogoutView,
-    PingView,
     RegistrationView,
     SecurePingView,
+    ping,
     resend_verification_email,
     verify_email,
 )
@@ -17,5 +17,5 @@ urlpatterns = [
     path("auth/verify-email/<uuid:token>/", verify_email, name="verify-email"),
     path("auth/resend-verification/", resend_verification_email, name="resend-verification"),
     path("secure-ping/", SecurePingView.as_view(), name="api-secure-ping"),
-    path("ping/", PingView.as_view(), name="api-ping"),
+    path("ping/", ping, name="api-ping"),
 ]
@@ -7,24 +7,32 @@ Handles sending verification emails, password resets, and other transactional em
 import logging
 
 from django.conf import settings
-from django.core.mail import send_mail
-from django.template.loader import render_to_string
+from django.core.mail import EmailMultiAlternatives
+from django.template.loader import get_template
 from django.utils.html import strip_tags
 
 logger = logging.getLogger(__name__)
 
+VERIFY_EMAIL_TEMPLATE = "emails/verify_email.html"
+WELCOME_EMAIL_TEMPLATE = "emails/welcome.html"
 
-def send_verification_email(user, verification_token):
-    """
-    Send email verification link to user.
 
-    Args:
-        user: User object
-        verification_token: UUID token for verification
+def _build_email(
+    subject: str, template_name: str, context: dict, recipient: str
+) -> EmailMultiAlternatives:
+    html_message = get_template(template_name).render(context)
+    message = EmailMultiAlternatives(
+        subject=subject,
+        body=strip_tags(html_message),
+        from_email=settings.DEFAULT_FROM_EMAIL,
+        to=[recipient],
+    )
+    message.attach_alternative(html_message, "text/html")
+    return message
 
-    Returns:
-        bool: True if email sent successfully, False otherwise
-    """
+
+def build_verification_email(user, verification_token) -> EmailMultiAlternatives:
+    """Build (but do not send) the email verification message for a user."""
     # Build verification URL
     verification_url = f"{settings.FRONTEND_URL}/verify-email/{verification_token}"
 
@@ -35,23 +43,36 @@ def send_verification_email(user, verification_token):
         "frontend_url": settings.FRONTEND_URL,
     }
 
-    # Render email template
-    html_message = render_to_string("emails/verify_email.html", context)
-    plain_message = strip_tags(html_message)
+    return _build_email(
+        "Verify your email address - StatusWatch", VERIFY_EMAIL_TEMPLATE, context, user.email
+    )
 
-    subject = "Verify your email address - StatusWatch"
-    from_email = settings.DEFAULT_FROM_EMAIL
-    recipient_list = [user.email]
+
+def build_welcome_email(user) -> EmailMultiAlternatives:
+    """Build (but do not send) the welcome message for a user."""
+    context = {
+        "user": user,
+        "frontend_url": settings.FRONTEND_URL,
+    }
+
+    return _build_email("Welcome to StatusWatch!", WELCOME_EMAIL_TEMPLATE, context, user.email)
+
+
+def send_verification_email(user, verification_token):
+    """
+    Send email verification link to user.
+
+    Args:
+        user: User object
+        verification_token: UUID token for verification
+
+    Returns:
+        bool: True if email sent successfully, False otherwise
+    """
+    message = build_verification_email(user, verification_token)
 
     try:
-        send_mail(
-            subject=subject,
-            message=plain_message,
-            from_email=from_email,
-            recipient_list=recipient_list,
-            html_message=html_message,
-            fail_silently=False,
-        )
+        message.send(fail_silently=False)
         logger.info(f"Verification email sent to {user.email}")
         return True
     except Exception as e:
@@ -69,27 +90,10 @@ def send_welcome_email(user):
     Returns:
         bool: True if email sent successfully, False otherwise
     """
-    context = {
-        "user": user,
-        "frontend_url": settings.FRONTEND_URL,
-    }
-
-    html_message = render_to_string("emails/welcome.html", context)
-    plain_message = strip_tags(html_message)
-
-    subject = "Welcome to StatusWatch!"
-    from_email = settings.DEFAULT_FROM_EMAIL
-    recipient_list = [user.email]
+    message = build_welcome_email(user)
 
     try:
-        send_mail(
-            subject=subject,
-            message=plain_message,
-            from_email=from_email,
-            recipient_list=recipient_list,
-            html_message=html_message,
-            fail_silently=True,  # Don't block on welcome email failure
-        )
+        message.send(fail_silently=True)  # Don't block on welcome email failure
         logger.info(f"Welcome email sent to {user.email}")
         return True
     except Exception as e:
@@ -1,9 +1,15 @@
+import hmac
 import json
 import logging
 from datetime import datetime
 from pathlib import Path
 
 from django.contrib.auth import get_user_model
+from django.http import HttpResponse
+from django.utils import timezone
+from django.views.decorators.http import require_safe
+from kombu.exceptions import OperationalError
+from modules.accounts.authentication import cache_blacklisted_jti
 from rest_framework import status
 from rest_framework.decorators import api_view
 from rest_framework.permissions import AllowAny, IsAuthenticated
@@ -11,13 +17,16 @@ from rest_framework.response import Response
 from rest_framework.views import APIView
 from rest_framework_simplejwt.exceptions import InvalidToken, TokenError
 from rest_framework_simplejwt.serializers import TokenObtainPairSerializer
+from rest_framework_simplejwt.settings import api_settings as jwt_api_settings
+from rest_framework_simplejwt.tokens import RefreshToken
 from rest_framework_simplejwt.views import TokenViewBase
 from tenants.models import SubscriptionStatus
 
 from .audit_log import AuditEvent, log_audit_event
-from .logging_utils import sanitize_log_value
-from .models import UserProfile
+from .logging_utils import get_client_ip, sanitize_log_value
+from .models import UserProfile, hash_verification_token
 from .serializers import RegistrationSerializer, UserSerializer
+from .tasks import blacklist_refresh_token_task, send_verification_email_task
 from .throttles import BurstRateThrottle, LoginRateThrottle, RegistrationRateThrottle
 
 auth_logger = logging.getLogger("api.auth")
@@ -38,15 +47,21 @@ def _write_debug_log(log_type: str, data: dict) -> None:
             f.write(json.dumps(entry) + "\n")
     except Exception as e:
         # Don't let logging failures break authentication
-        auth_logger.error(f"Failed to write debug log: {e}")
+        auth_logger.error("Failed to write debug log: %s", e)
 
 
-class PingView(APIView):
-    authentication_classes: list[type] = []
-    permission_classes: list[type] = []
+PING_RESPONSE_BODY = b'{"ok":true}'
 
-    def get(self, request):
-        return Response({"ok": True})
+
+@require_safe
+def ping(request):
+    """
+    Liveness probe for load balancers.
+
+    A plain Django view with a precomputed body: the payload never changes, so
+    DRF's parsing, content negotiation and rendering would be pure overhead.
+    """
+    return HttpResponse(PING_RESPONSE_BODY, content_type="application/json")
 
 
 class SecurePingView(APIView):
@@ -67,15 +82,16 @@ class CurrentUserView(APIView):
 
     def get(self, request):
         tenant = getattr(request, "tenant", None)
-        auth_logger.info(
-            "Fetched current user profile",
-            extra={
-                "user_id": getattr(request.user, "id", None),
-                "email": getattr(request.user, "email", None),
-                "schema_name": getattr(tenant, "schema_name", "public"),
-                "ip_address": TokenObtainPairWithLoggingView._extract_ip(request),
-            },
-        )
+        if auth_logger.isEnabledFor(logging.INFO):
+            auth_logger.info(
+                "Fetched current user profile",
+                extra={
+                    "user_id": getattr(request.user, "id", None),
+                    "email": getattr(request.user, "email", None),
+                    "schema_name": getattr(tenant, "schema_name", "public"),
+                    "ip_address": get_client_ip(request),
+                },
+            )
         serializer = UserSerializer(request.user)
         data = dict(serializer.data)
         plan = getattr(tenant, "subscription_status", SubscriptionStatus.FREE)
@@ -109,7 +125,7 @@ class RegistrationView(APIView):
                 event=AuditEvent.USER_REGISTERED,
                 user_id=payload.get("user", {}).get("id"),
                 user_email=payload.get("user", {}).get("email"),
-                ip_address=TokenObtainPairWithLoggingView._extract_ip(request),
+                ip_address=get_client_ip(request),
                 tenant_schema=payload.get("tenant", {}).get("schema_name"),
                 details={"org_name": payload.get("tenant", {}).get("name")},
             )
@@ -118,7 +134,7 @@ class RegistrationView(APIView):
                 event=AuditEvent.TENANT_CREATED,
                 user_id=payload.get("user", {}).get("id"),
                 user_email=payload.get("user", {}).get("email"),
-                ip_address=TokenObtainPairWithLoggingView._extract_ip(request),
+                ip_address=get_client_ip(request),
                 tenant_schema=payload.get("tenant", {}).get("schema_name"),
                 details={
                     "org_name": payload.get("tenant", {}).get("name"),
@@ -142,7 +158,7 @@ class TokenObtainPairWithLoggingView(TokenViewBase):
         serializer = self.get_serializer(data=request.data)
         username = request.data.get("username") or request.data.get("email")
         password = request.data.get("password", "")
-        ip_address = self._extract_ip(request)
+        ip_address = get_client_ip(request)
         tenant = getattr(request, "tenant", None)
         schema_name = getattr(tenant, "schema_name", "public")
         user_agent = request.META.get("HTTP_USER_AGENT", "")
@@ -284,13 +300,6 @@ class TokenObtainPairWithLoggingView(TokenViewBase):
 
         return Response(serializer.validated_data, status=status.HTTP_200_OK)
 
-    @staticmethod
-    def _extract_ip(request):
-        forwarded_for = request.META.get("HTTP_X_FORWARDED_FOR")
-        if forwarded_for:
-            return forwarded_for.split(",")[0].strip()
-        return request.META.get("REMOTE_ADDR", "unknown")
-
 
 @api_view(["GET", "POST"])
 def verify_email(request, token):
@@ -309,9 +318,19 @@ def verify_email(request, token):
         400: Invalid or expired token
         404: Token not found
     """
-    try:
-        profile = UserProfile.objects.select_related("user").get(email_verification_token=token)
-    except UserProfile.DoesNotExist:
+    # Look up by the compact 64-bit token hash, then confirm the full token in constant time.
+    candidates = UserProfile.objects.only(
+        "id", "email_verified", "email_verification_sent_at", "email_verification_token"
+    ).filter(email_verification_token_hash=hash_verification_token(token))
+    profile = next(
+        (
+            candidate
+            for candidate in candidates
+            if hmac.compare_digest(candidate.email_verification_token.bytes, token.bytes)
+        ),
+        None,
+    )
+    if profile is None:
         return Response({"error": "Invalid verification token."}, status=status.HTTP_404_NOT_FOUND)
 
     # Check if already verified
@@ -327,9 +346,15 @@ def verify_email(request, token):
             status=status.HTTP_400_BAD_REQUEST,
         )
 
-    # Verify the email
-    profile.email_verified = True
-    profile.save()
+    # Verify the email with a conditional single-row UPDATE so concurrent requests
+    # for the same token cannot both report a fresh verification.
+    updated = UserProfile.objects.filter(pk=profile.pk, email_verified=False).update(
+        email_verified=True, updated_at=timezone.now()
+    )
+    if updated == 0:
+        return Response(
+            {"detail": "Email already verified. You can now log in."}, status=status.HTTP_200_OK
+        )
 
     return Response(
         {"detail": "Email verified successfully! You can now log in."}, status=status.HTTP_200_OK
@@ -346,32 +371,36 @@ def resend_verification_email(request):
 
     Rate limited to prevent abuse.
 
+    The email itself is delivered by a Celery task so the SMTP round-trip
+    does not hold the request worker.
+
     Returns:
-        200: Email resent successfully
+        202: Verification email queued
         400: Email already verified or rate limit exceeded
     """
     if not request.user.is_authenticated:
         return Response({"error": "Authentication required."}, status=status.HTTP_401_UNAUTHORIZED)
 
-    try:
-        profile = request.user.profile
-    except UserProfile.DoesNotExist:
+    profile = UserProfile.objects.filter(user_id=request.user.id).first()
+    if profile is None:
         return Response({"error": "User profile not found."}, status=status.HTTP_404_NOT_FOUND)
 
     if profile.email_verified:
         return Response({"error": "Email is already verified."}, status=status.HTTP_400_BAD_REQUEST)
 
-    # Regenerate token and send email
+    # Regenerate token and queue the email
     profile.regenerate_verification_token()
 
-    # Import here to avoid circular dependency
-    from .utils import send_verification_email
-
-    send_verification_email(request.user, profile.email_verification_token)
+    tenant = getattr(request, "tenant", None)
+    send_verification_email_task.delay(
+        request.user.id,
+        str(profile.email_verification_token),
+        getattr(tenant, "schema_name", "public"),
+    )
 
     return Response(
         {"detail": "Verification email has been resent. Please check your inbox."},
-        status=status.HTTP_200_OK,
+        status=status.HTTP_202_ACCEPTED,
     )
 
 
@@ -399,7 +428,7 @@ class LogoutView(APIView):
         user = request.user
         tenant = getattr(request, "tenant", None)
         schema_name = getattr(tenant, "schema_name", "public")
-        ip_address = TokenObtainPairWithLoggingView._extract_ip(request)
+        ip_address = get_client_ip(request)
 
         if not refresh_token:
             auth_logger.warning(
@@ -416,11 +445,30 @@ class LogoutView(APIView):
                 status=status.HTTP_400_BAD_REQUEST,
             )
 
-        from rest_framework_simplejwt.tokens import RefreshToken
-
         try:
             token = RefreshToken(refresh_token)
-            token.blacklist()
+            jti = token.get("jti")
+            exp = token.get("exp")
+            try:
+                # Revoke immediately via the cache; the blacklist row is written by Celery.
+                cache_blacklisted_jti(jti, exp)
+            except Exception as exc:
+                # Cache unavailable: nothing revokes the token until the row exists.
+                auth_logger.warning(
+                    "Logout revocation cache unavailable; blacklisting synchronously: %s",
+                    sanitize_log_value(str(exc)),
+                )
+                token.blacklist()
+            else:
+                try:
+                    # Only the jti/user/exp are queued; the refresh token itself never
+                    # reaches the broker or task-argument reporting.
+                    blacklist_refresh_token_task.delay(
+                        jti, token.get(jwt_api_settings.USER_ID_CLAIM), exp, schema_name
+                    )
+                except OperationalError:
+                    # Broker unavailable: persist synchronously so the logout stays durable.
+                    token.blacklist()
         except TokenError as exc:
             auth_logger.warning(
                 "Logout failed",
@@ -452,15 +500,16 @@ class LogoutView(APIView):
                 status=status.HTTP_400_BAD_REQUEST,
             )
 
-        auth_logger.info(
-            "Logout successful",
-            extra={
-                "user_id": getattr(user, "id", None),
-                "email": getattr(user, "email", None),
-                "schema_name": schema_name,
-                "ip_address": sanitize_log_value(ip_address),
-            },
-        )
+        if auth_logger.isEnabledFor(logging.INFO):
+            auth_logger.info(
+                "Logout successful",
+                extra={
+                    "user_id": getattr(user, "id", None),
+                    "email": getattr(user, "email", None),
+                    "schema_name": schema_name,
+                    "ip_address": sanitize_log_value(ip_address),
+                },
+            )
 
         return Response(
             {"detail": "Logout successful. You have been logged out."},
@@ -500,7 +549,8 @@ def validate_domain_for_tls(request):
 
     if exists:
         auth_logger.info(
-            f"TLS validation SUCCESS for domain: {domain}",
+            "TLS validation SUCCESS for domain: %s",
+            domain,
             extra={
                 "domain": domain,
                 "validation": "success",
@@ -513,7 +563,8 @@ def validate_domain_for_tls(request):
         )
     else:
         auth_logger.warning(
-            f"TLS validation REJECTED for domain: {domain}",
+            "TLS validation REJECTED for domain: %s",
+            domain,
             extra={
                 "domain": domain,
                 "validation": "rejected",
@@ -1,12 +1,19 @@
 import os
 
 from celery import Celery
-from modules.core.settings import setup_settings_logging
+from modules.core.settings import load_env_file, setup_settings_logging
+
+from app.celery_serializer import register_orjson_serializer
 
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", "app.settings")
+# No-op if settings helpers already read .env; makes the ordering explicit for workers.
+load_env_file()
 
 setup_settings_logging(logger_name="app.settings_loader.celery")
 
+# Must be registered before the CELERY_* serializer settings are applied.
+register_orjson_serializer()
+
 celery_app = Celery("app")
 celery_app.config_from_object("django.conf:settings", namespace="CELERY")
 
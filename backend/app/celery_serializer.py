@@ -0,0 +1,32 @@
+"""orjson-backed kombu serializer for Celery task and result messages."""
+
+from decimal import Decimal
+
+import orjson
+from kombu.serialization import register
+
+ORJSON_SERIALIZER = "orjson"
+ORJSON_CONTENT_TYPE = "application/x-orjson"
+
+# Non-string dict keys are stringified like the stdlib json serializer does.
+_DUMPS_OPTIONS = orjson.OPT_NON_STR_KEYS
+
+
+def _default(obj):
+    if isinstance(obj, Decimal):
+        return str(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def orjson_dumps(obj) -> bytes:
+    return orjson.dumps(obj, default=_default, option=_DUMPS_OPTIONS)
+
+
+def register_orjson_serializer() -> None:
+    register(
+        ORJSON_SERIALIZER,
+        orjson_dumps,
+        orjson.loads,
+        content_type=ORJSON_CONTENT_TYPE,
+        content_encoding="utf-8",
+    )
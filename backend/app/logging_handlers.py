@@ -0,0 +1,72 @@
+"""Custom logging handlers for the StatusWatch project."""
+
+import atexit
+import os
+import threading
+import weakref
+from logging.handlers import QueueHandler
+
+
+class BackgroundQueueHandler(QueueHandler):
+    """
+    QueueHandler whose dictConfig-built QueueListener is started on first use.
+
+    Logging calls only enqueue the record; the listener thread performs the blocking
+    writes to the target handlers. The listener is started lazily (and again after a
+    fork) so it also runs in gunicorn --preload / Celery prefork workers, which do not
+    inherit the parent's thread.
+    """
+
+    # Weak, so handlers replaced by a later dictConfig call can be collected; the fork
+    # and exit hooks below are registered once for the class and walk this set.
+    _instances: "weakref.WeakSet[BackgroundQueueHandler]" = weakref.WeakSet()
+
+    def __init__(self, queue) -> None:
+        super().__init__(queue)
+        self._listener_lock = threading.Lock()
+        self._listener_started = False
+        self._instances.add(self)
+
+    def emit(self, record) -> None:
+        if not self._listener_started:
+            self._start_listener()
+        super().emit(record)
+
+    def close(self) -> None:
+        self._stop_listener()
+        self._instances.discard(self)
+        super().close()
+
+    def _start_listener(self) -> None:
+        with self._listener_lock:
+            if not self._listener_started and self.listener is not None:
+                self.listener.start()
+                self._listener_started = True
+
+    def _stop_listener(self) -> None:
+        with self._listener_lock:
+            if self._listener_started and self.listener is not None:
+                self.listener.stop()
+            self._listener_started = False
+
+    def _forget_listener(self) -> None:
+        # The parent's listener thread does not exist in the child, and the inherited
+        # queue still has that thread registered as a waiter; start over with both.
+        self._listener_lock = threading.Lock()
+        self._listener_started = False
+        if self.listener is not None:
+            self.queue = self.listener.queue = type(self.queue)()
+
+    @classmethod
+    def _forget_all_listeners(cls) -> None:
+        for handler in list(cls._instances):
+            handler._forget_listener()
+
+    @classmethod
+    def _stop_all_listeners(cls) -> None:
+        for handler in list(cls._instances):
+            handler._stop_listener()
+
+
+os.register_at_fork(after_in_child=BackgroundQueueHandler._forget_all_listeners)
+atexit.register(BackgroundQueueHandler._stop_all_listeners)
@@ -2,7 +2,7 @@
 CORS Logging Middleware
 
 Logs all CORS-related request/response headers to help debug multi-tenant subdomain access.
-Writes to: backend/logs/cors_debug.log
+Writes to: backend/logs/cors_debug.log (via the "cors_debug" logger in LOGGING)
 
 This middleware should be placed AFTER CorsMiddleware in MIDDLEWARE setting.
 """
@@ -10,31 +10,25 @@ This middleware should be placed AFTER CorsMiddleware in MIDDLEWARE setting.
 import logging
 import re
 from collections.abc import Callable
-from pathlib import Path
 
 from django.conf import settings
 from django.http import HttpRequest, HttpResponse
 
-# Configure CORS debug logger
-LOGS_DIR = Path(settings.BASE_DIR) / "logs"
-LOGS_DIR.mkdir(exist_ok=True)
-
+# Handlers come from LOGGING ("cors_debug"): queued, with the file opened lazily.
 cors_logger = logging.getLogger("cors_debug")
-cors_logger.setLevel(logging.DEBUG)
-
-# File handler for CORS logs
-cors_log_file = LOGS_DIR / "cors_debug.log"
-file_handler = logging.FileHandler(cors_log_file)
-file_handler.setLevel(logging.DEBUG)
 
-# Detailed formatter
-formatter = logging.Formatter(
-    fmt="%(asctime)s [%(levelname)s] %(message)s",
-    datefmt="%Y-%m-%d %H:%M:%S",
+BANNER_RULE = "=" * 80
+
+# Response headers django-cors-headers can set (lookups are case-insensitive)
+CORS_RESPONSE_HEADERS = (
+    "Access-Control-Allow-Origin",
+    "Access-Control-Allow-Credentials",
+    "Access-Control-Allow-Methods",
+    "Access-Control-Allow-Headers",
+    "Access-Control-Expose-Headers",
+    "Access-Control-Max-Age",
+    "Access-Control-Allow-Private-Network",
 )
-file_handler.setFormatter(formatter)
-cors_logger.addHandler(file_handler)
-cors_logger.propagate = False  # Don't propagate to root logger
 
 
 class CorsLoggingMiddleware:
@@ -55,22 +49,35 @@ class CorsLoggingMiddleware:
         self.get_response = get_response
 
         # Get CORS config for validation
-        self.allowed_origins = getattr(settings, "CORS_ALLOWED_ORIGINS", [])
+        # frozenset: origin membership is checked on every CORS request
+        self.allowed_origins = frozenset(getattr(settings, "CORS_ALLOWED_ORIGINS", ()))
         self.allowed_regexes = getattr(settings, "CORS_ALLOWED_ORIGIN_REGEXES", [])
+        self._compiled_regexes = self._compile_regexes(self.allowed_regexes)
         self.allow_all = getattr(settings, "CORS_ALLOW_ALL_ORIGINS", False)
 
-        cors_logger.info("=" * 80)
-        cors_logger.info("CORS Logging Middleware initialized")
-        cors_logger.info(f"CORS_ALLOW_ALL_ORIGINS: {self.allow_all}")
-        cors_logger.info(f"CORS_ALLOWED_ORIGINS: {self.allowed_origins}")
-        cors_logger.info(f"CORS_ALLOWED_ORIGIN_REGEXES: {self.allowed_regexes}")
-        cors_logger.info("=" * 80)
+        # One multi-line record instead of one handler round-trip per line
+        cors_logger.info(
+            "%s\nCORS Logging Middleware initialized\n"
+            "CORS_ALLOW_ALL_ORIGINS: %s\n"
+            "CORS_ALLOWED_ORIGINS: %s\n"
+            "CORS_ALLOWED_ORIGIN_REGEXES: %s\n%s",
+            BANNER_RULE,
+            self.allow_all,
+            sorted(self.allowed_origins),
+            self.allowed_regexes,
+            BANNER_RULE,
+        )
 
     def __call__(self, request: HttpRequest) -> HttpResponse:
+        debug_on = cors_logger.isEnabledFor(logging.DEBUG)
+        warn_on = cors_logger.isEnabledFor(logging.WARNING)
+        if not (debug_on or warn_on):
+            # Nothing would be written, so skip header extraction and formatting.
+            return self.get_response(request)
+
         # Extract key headers
         origin = request.headers.get("Origin", None)
         host = request.headers.get("Host", None)
-        referer = request.headers.get("Referer", None)
         method = request.method
         path = request.path
 
@@ -81,25 +88,32 @@ class CorsLoggingMiddleware:
             # CORS request with Origin header
             origin_allowed = self._check_origin_allowed(origin)
 
-            cors_logger.debug(
-                f"[CORS REQUEST] {method} {path} | "
-                f"Origin: {origin} | "
-                f"Host: {host} | "
-                f"Allowed: {origin_allowed}"
-            )
+            if debug_on:
+                cors_logger.debug(
+                    "[CORS REQUEST] %s %s | Origin: %s | Host: %s | Allowed: %s",
+                    method,
+                    path,
+                    origin,
+                    host,
+                    origin_allowed,
+                )
 
-            if not origin_allowed:
+            if not origin_allowed and warn_on:
                 cors_logger.warning(
-                    f"[CORS BLOCKED?] Origin '{origin}' may not match allowed patterns. "
-                    f"Request: {method} {path}"
+                    "[CORS BLOCKED?] Origin '%s' may not match allowed patterns. Request: %s %s",
+                    origin,
+                    method,
+                    path,
                 )
-        elif is_api_request:
+        elif is_api_request and debug_on:
             # API request without Origin (likely proxied)
             cors_logger.debug(
-                f"[PROXY REQUEST] {method} {path} | "
-                f"Host: {host} | "
-                f"Referer: {referer} | "
-                f"No Origin header (likely Vite proxy)"
+                "[PROXY REQUEST] %s %s | Host: %s | Referer: %s | "
+                "No Origin header (likely Vite proxy)",
+                method,
+                path,
+                host,
+                request.headers.get("Referer", None),
             )
 
         # Process request
@@ -108,30 +122,35 @@ class CorsLoggingMiddleware:
         # Log CORS response headers if present
         if origin:
             cors_headers = {
-                key: value
-                for key, value in response.items()
-                if key.lower().startswith("access-control-")
+                header: response[header] for header in CORS_RESPONSE_HEADERS if header in response
             }
 
             if cors_headers:
-                cors_logger.debug(
-                    f"[CORS RESPONSE] {method} {path} | "
-                    f"Status: {response.status_code} | "
-                    f"Headers: {cors_headers}"
-                )
-            else:
+                if debug_on:
+                    cors_logger.debug(
+                        "[CORS RESPONSE] %s %s | Status: %s | Headers: %s",
+                        method,
+                        path,
+                        response.status_code,
+                        cors_headers,
+                    )
+            elif warn_on:
                 cors_logger.warning(
-                    f"[CORS NO HEADERS] {method} {path} | "
-                    f"Status: {response.status_code} | "
-                    f"Origin: {origin} | "
-                    f"No CORS headers in response - possible misconfiguration"
+                    "[CORS NO HEADERS] %s %s | Status: %s | Origin: %s | "
+                    "No CORS headers in response - possible misconfiguration",
+                    method,
+                    path,
+                    response.status_code,
+                    origin,
                 )
-        elif is_api_request:
+        elif is_api_request and debug_on:
             # Log proxy response status
             cors_logger.debug(
-                f"[PROXY RESPONSE] {method} {path} | "
-                f"Status: {response.status_code} | "
-                f"Host: {host}"
+                "[PROXY RESPONSE] %s %s | Status: %s | Host: %s",
+                method,
+                path,
+                response.status_code,
+                host,
             )
 
         return response
@@ -154,11 +173,15 @@ class CorsLoggingMiddleware:
             return True
 
         # Check regex patterns
-        for pattern in self.allowed_regexes:
+        return any(pattern.match(origin) for pattern in self._compiled_regexes)
+
+    @staticmethod
+    def _compile_regexes(patterns) -> tuple[re.Pattern[str], ...]:
+        """Compile CORS origin regexes once, logging and skipping invalid ones."""
+        compiled = []
+        for pattern in patterns:
             try:
-                if re.match(pattern, origin):
-                    return True
+                compiled.append(re.compile(pattern))
             except re.error as e:
-                cors_logger.error(f"Invalid regex pattern '{pattern}': {e}")
-
-        return False
+                cors_logger.error("Invalid regex pattern '%s': %s", pattern, e)
+        return tuple(compiled)
@@ -23,38 +23,36 @@ class InternalEndpointMiddleware:
     - /metrics/ (Monitoring - if unauthenticated)
     """
 
-    # Paths that should allow HTTP access
-    HTTP_ALLOWED_PATHS = [
+    # Paths that should allow HTTP access (a tuple: str.startswith checks all in one call)
+    HTTP_ALLOWED_PATHS = (
         "/api/internal/validate-domain/",
         "/health/",
         "/health/live/",
         "/health/ready/",
         "/healthz",
         "/metrics/",
-    ]
+    )
 
     def __init__(self, get_response):
         self.get_response = get_response
 
     def __call__(self, request):
         # Check if this is an internal endpoint that should allow HTTP
-        if self._is_internal_endpoint(request.path):
+        if request.path.startswith(self.HTTP_ALLOWED_PATHS):
             # Mark request to skip HTTPS redirect in SecurityMiddleware
             request._skip_secure_redirect = True
 
-            logger.debug(
-                f"Internal endpoint accessed via HTTP: {request.path}",
-                extra={
-                    "path": request.path,
-                    "method": request.method,
-                    "remote_addr": request.META.get("REMOTE_ADDR"),
-                    "http_allowed": True,
-                },
-            )
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    "Internal endpoint accessed via HTTP: %s",
+                    request.path,
+                    extra={
+                        "path": request.path,
+                        "method": request.method,
+                        "remote_addr": request.META.get("REMOTE_ADDR"),
+                        "http_allowed": True,
+                    },
+                )
 
         response = self.get_response(request)
         return response
-
-    def _is_internal_endpoint(self, path):
-        """Check if path is an internal endpoint that allows HTTP."""
-        return any(path.startswith(allowed_path) for allowed_path in self.HTTP_ALLOWED_PATHS)
@@ -5,18 +5,23 @@ Logs all API requests and responses with timing, user context, and tenant inform
 """
 
 import logging
+import os
 import time
 
-from api.logging_utils import sanitize_log_value
-from django.utils.deprecation import MiddlewareMixin
+from api.logging_utils import get_client_ip, sanitize_log_value
 
 request_logger = logging.getLogger("api.requests")
 
 
-class RequestLoggingMiddleware(MiddlewareMixin):
+class RequestLoggingMiddleware:
     """
     Log all API requests and responses with timing information.
 
+    Also generates the unique request ID used to track a request across systems:
+    - Added to the request object as `request.id` (128 random bits as 32 hex chars)
+    - Included in response headers as `X-Request-ID`
+    - Available for logging and error tracking
+
     Logs include:
     - Request method, path, query parameters
     - User ID and tenant context
@@ -24,88 +29,130 @@ class RequestLoggingMiddleware(MiddlewareMixin):
     - Response status code and size
     - Request duration in milliseconds
 
-    All sensitive data is sanitized before logging.
+    All sensitive data is sanitized before logging. Static assets, health
+    probes and metrics scrapes (SKIP_PREFIXES) are not logged.
     """
 
+    SKIP_PREFIXES = ("/static/", "/media/", "/health/", "/healthz", "/metrics/", "/favicon.ico")
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        self.process_request(request)
+        response = self.get_response(request)
+        return self.process_response(request, response)
+
     def process_request(self, request):
-        """Log incoming request and start timer."""
-        request._start_time = time.time()
+        """Assign the request ID, log the incoming request and start the timer."""
+        request.id = os.urandom(16).hex()
+
+        if request.path.startswith(self.SKIP_PREFIXES):
+            request._skip_logging = True
+            return
+
+        request._start_time = time.perf_counter()
+        # Sanitized once here and reused by process_response
+        request._sanitized_path = sanitize_log_value(request.path)
+
+        if not request_logger.isEnabledFor(logging.INFO):
+            return
 
         # Log incoming request
         request_logger.info(
             "Incoming request",
             extra={
-                "request_id": getattr(request, "id", None),
+                "request_id": request.id,
                 "method": request.method,
-                "path": sanitize_log_value(request.path),
-                "query_params": sanitize_log_value(dict(request.GET)),
-                "ip_address": self._get_client_ip(request),
+                "path": request._sanitized_path,
+                "query_params": self._get_query_params(request),
+                "ip_address": get_client_ip(request),
                 "user_agent": request.META.get("HTTP_USER_AGENT", ""),
-                "user_id": getattr(request.user, "id", None) if hasattr(request, "user") else None,
-                "tenant": (
-                    getattr(request.tenant, "schema_name", None)
-                    if hasattr(request, "tenant")
-                    else None
-                ),
+                "user_id": self._get_user_id(request),
+                "tenant": getattr(getattr(request, "tenant", None), "schema_name", None),
             },
         )
 
     def process_response(self, request, response):
-        """Log response with timing information."""
+        """Add the X-Request-ID header and log the response with timing information."""
+        request_id = getattr(request, "id", None)
+        if request_id is not None:
+            response["X-Request-ID"] = request_id
+
+        if getattr(request, "_skip_logging", False):
+            return response
+
         # Calculate request duration
         if hasattr(request, "_start_time"):
-            duration_ms = (time.time() - request._start_time) * 1000
+            duration_ms = (time.perf_counter() - request._start_time) * 1000
         else:
             duration_ms = 0
 
         # Determine log level based on status code
         log_level = logging.WARNING if response.status_code >= 400 else logging.INFO
 
+        if not request_logger.isEnabledFor(log_level):
+            return response
+
+        sanitized_path = getattr(request, "_sanitized_path", None)
+        if sanitized_path is None:
+            sanitized_path = sanitize_log_value(request.path)
+
         # Log response
         request_logger.log(
             log_level,
             "Request completed",
             extra={
-                "request_id": getattr(request, "id", None),
+                "request_id": request_id,
                 "method": request.method,
-                "path": sanitize_log_value(request.path),
+                "path": sanitized_path,
                 "status_code": response.status_code,
                 "duration_ms": round(duration_ms, 2),
-                "response_size_bytes": len(response.content) if hasattr(response, "content") else 0,
-                "user_id": getattr(request.user, "id", None) if hasattr(request, "user") else None,
+                "response_size_bytes": self._get_response_size(response),
+                "user_id": self._get_user_id(request),
             },
         )
 
         return response
 
     @staticmethod
-    def _get_client_ip(request):
-        """Extract client IP address from request, handling proxies."""
-        x_forwarded_for = request.META.get("HTTP_X_FORWARDED_FOR")
-        if x_forwarded_for:
-            # Get first IP in chain (original client)
-            return x_forwarded_for.split(",")[0].strip()
-        return request.META.get("REMOTE_ADDR", "unknown")
-
-
-class RequestIDMiddleware(MiddlewareMixin):
-    """
-    Generate unique request ID for tracking requests across systems.
+    def _get_query_params(request):
+        """
+        Sanitized query parameters, or {} without building request.GET when there are none.
 
-    The request ID is:
-    - Added to the request object as `request.id`
-    - Included in response headers as `X-Request-ID`
-    - Available for logging and error tracking
-    """
+        The decoded QueryDict is still used when parameters exist: sanitizing the raw
+        percent-encoded QUERY_STRING would miss encoded secrets such as DSNs.
+        """
+        if not request.META.get("QUERY_STRING"):
+            return {}
+        return sanitize_log_value(dict(request.GET))
 
-    def process_request(self, request):
-        """Generate and attach unique request ID."""
-        import uuid
+    @staticmethod
+    def _get_user_id(request):
+        """
+        User ID for the log record, read with a single getattr.
 
-        request.id = str(uuid.uuid4())
+        Only called once the record is known to be emitted, so the lazy user is
+        never resolved for filtered records. Not cached across phases: DRF
+        authenticates inside the view, so process_response can see a user that
+        process_request did not.
+        """
+        return getattr(getattr(request, "user", None), "id", None)
 
-    def process_response(self, request, response):
-        """Add request ID to response headers."""
-        if hasattr(request, "id"):
-            response["X-Request-ID"] = request.id
-        return response
+    @staticmethod
+    def _get_response_size(response):
+        """
+        Size of the response body in bytes, without consuming streaming responses.
+
+        Prefers the Content-Length header; streaming responses without one report 0
+        rather than being drained here.
+        """
+        content_length = response.get("Content-Length")
+        if content_length:
+            try:
+                return int(content_length)
+            except ValueError:
+                pass
+        if getattr(response, "streaming", False):
+            return 0
+        return len(response.content)
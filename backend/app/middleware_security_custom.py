@@ -17,15 +17,12 @@ class CustomSecurityMiddleware(DjangoSecurityMiddleware):
     """
 
     def process_request(self, request):
-        # Check if this request should skip HTTPS redirect
+        # Django's process_request only ever returns the HTTPS redirect, so skipping
+        # it entirely is the same as running it with redirect disabled. Response
+        # headers are still applied in process_response. The shared middleware
+        # instance is never mutated, which keeps this safe across threads.
         if getattr(request, "_skip_secure_redirect", False):
-            # Temporarily disable SSL redirect for this request only
-            original_redirect = self.redirect
-            self.redirect = False
-            try:
-                return super().process_request(request)
-            finally:
-                self.redirect = original_redirect
+            return None
 
         # Normal security processing for all other requests
         return super().process_request(request)
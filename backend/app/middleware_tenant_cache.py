@@ -0,0 +1,18 @@
+"""
+django-tenants main middleware with a cached hostname -> tenant lookup.
+"""
+
+from django_tenants.middleware.main import TenantMainMiddleware
+from modules.tenancy.cache import get_cached_tenant
+
+
+class CachedTenantMainMiddleware(TenantMainMiddleware):
+    """
+    TenantMainMiddleware that resolves the request hostname through the shared cache.
+
+    Saves the Domain/Client join on every request; entries are dropped when the
+    tenant or one of its domains is saved or deleted (see tenants.apps).
+    """
+
+    def get_tenant(self, domain_model, hostname):
+        return get_cached_tenant(domain_model, hostname)
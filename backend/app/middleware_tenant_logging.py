@@ -19,27 +19,23 @@ class TenantRoutingLoggingMiddleware:
         self.get_response = get_response
 
     def __call__(self, request):
+        if logger.isEnabledFor(logging.INFO):
+            self._log_routing(request)
+
+        response = self.get_response(request)
+        return response
+
+    @staticmethod
+    def _log_routing(request):
         # Get tenant info (set by TenantMainMiddleware)
         host = request.get_host()
 
-        # Check if tenant was set
-        tenant_name = "UNKNOWN"
-        schema_name = "UNKNOWN"
-
-        if hasattr(request, "tenant"):
-            tenant = request.tenant
-            if hasattr(tenant, "name"):
-                tenant_name = tenant.name
-            if hasattr(tenant, "schema_name"):
-                schema_name = tenant.schema_name
+        # Tenant may be unset (or partial) if TenantMainMiddleware did not resolve one
+        tenant = getattr(request, "tenant", None)
+        tenant_name = getattr(tenant, "name", "UNKNOWN")
+        schema_name = getattr(tenant, "schema_name", "UNKNOWN")
 
-        # Log the routing decision
+        # Log the routing decision (console visibility comes from the logging config)
         logger.info(
-            f"[TENANT ROUTING] Host: {host} → Schema: {schema_name} (Tenant: {tenant_name})"
+            "[TENANT ROUTING] Host: %s → Schema: %s (Tenant: %s)", host, schema_name, tenant_name
         )
-
-        # Also log to console for immediate visibility
-        print(f"🔍 [TENANT ROUTING] Host: {host} → Schema: {schema_name} (Tenant: {tenant_name})")
-
-        response = self.get_response(request)
-        return response
@@ -1,9 +1,25 @@
 """Settings router for StatusWatch project."""
 
-import os
+import importlib
+import sys
+from typing import TYPE_CHECKING
 
 from modules.core.settings import setup_settings_logging
 
+if TYPE_CHECKING:
+    # The names are copied in at runtime below; this lets mypy/django-stubs see them.
+    from app.settings_development import *  # noqa: F403
+
+
+def _load_environment_settings(module_name: str):
+    """Return the environment settings module, importing it only if not loaded yet."""
+
+    module = sys.modules.get(module_name)
+    if module is None:
+        module = importlib.import_module(module_name)
+    return module
+
+
 # -------------------------------------------------------------------
 # Environment Detection + Logging (shared helper)
 # -------------------------------------------------------------------
@@ -11,35 +27,21 @@ logging_context = setup_settings_logging()
 settings_logger = logging_context.logger
 environment = logging_context.environment
 
-if environment == "development":
-    from app.settings_development import *  # noqa: F403, F401
-
-    settings_logger.info("✅ Development settings loaded successfully")
-    settings_logger.info("   - DEBUG: True")
-    settings_logger.info("   - ALLOWED_HOSTS: Permissive (localhost, *.local)")
-    settings_logger.info("   - CORS: Permissive (localhost:5173)")
-    settings_logger.info("   - HTTPS: Disabled")
-    settings_logger.info("   - Email: Console backend")
-    settings_logger.info("   - Stripe: Validation disabled")
-    settings_logger.info("   - Sentry: Disabled")
-elif environment == "production":
-    from app.settings_production import *  # noqa: F403, F401
-
-    settings_logger.info("✅ Production settings loaded successfully")
-    settings_logger.info("   - DEBUG: False")
-    settings_logger.info("   - ALLOWED_HOSTS: From env (strict)")
-    settings_logger.info("   - CORS: From env (strict)")
-    settings_logger.info("   - HTTPS: Enforced")
-    settings_logger.info("   - Email: SMTP backend")
-    settings_logger.info("   - Stripe: Validation enabled")
-
-    # Only log Sentry status if DSN is set
-    sentry_dsn = os.environ.get("SENTRY_DSN", "")
-    if sentry_dsn:
-        settings_logger.info(
-            f"   - Sentry: Enabled ({os.environ.get('SENTRY_ENVIRONMENT', 'production')})"
-        )
-    else:
-        settings_logger.info("   - Sentry: Disabled (no DSN)")
-
-settings_logger.info("=" * 70)
+# Django only reads UPPERCASE names, so copy just the public ones in a single update.
+_environment_settings = _load_environment_settings(f"app.settings_{environment}")
+globals().update(
+    {
+        name: value
+        for name, value in vars(_environment_settings).items()
+        if name.isupper() and not name.startswith("_")
+    }
+)
+
+# One multi-line record per process; only the Sentry status varies. A re-run of this
+# module (importlib.reload, runpy) keeps its namespace, so the flag survives it.
+if not globals().get("_banner_logged"):
+    logging_context.log_loaded_banner(
+        _environment_settings.SENTRY_DSN, getattr(_environment_settings, "SENTRY_ENVIRONMENT", None)
+    )
+    logging_context.flush()
+    _banner_logged = True
@@ -7,6 +7,9 @@ Environment-specific overrides are in settings_development.py and settings_produ
 
 from modules.core.settings import (
     BASE_DIR,
+    STATIC_SERVING_APPS,
+    STATIC_SERVING_MIDDLEWARE,
+    build_cache_config,
     build_celery_config,
     build_default_database_config,
     build_email_defaults,
@@ -35,9 +38,15 @@ from modules.core.settings import (
 from modules.core.settings import (
     SHOW_PUBLIC_IF_NO_TENANT_FOUND as CORE_SHOW_PUBLIC_IF_NO_TENANT_FOUND,
 )
+from modules.core.settings import (
+    TENANT_CACHE_TIMEOUT as CORE_TENANT_CACHE_TIMEOUT,
+)
 from modules.core.settings import (
     TENANT_DOMAIN_MODEL as CORE_TENANT_DOMAIN_MODEL,
 )
+from modules.core.settings import (
+    TENANT_LIMIT_SET_CALLS as CORE_TENANT_LIMIT_SET_CALLS,
+)
 from modules.core.settings import (
     TENANT_MODEL as CORE_TENANT_MODEL,
 )
@@ -60,12 +69,27 @@ PUBLIC_SCHEMA_NAME = CORE_PUBLIC_SCHEMA_NAME
 # Allow internal requests (e.g., from Caddy with Host: web:8000) to use public schema
 SHOW_PUBLIC_IF_NO_TENANT_FOUND = CORE_SHOW_PUBLIC_IF_NO_TENANT_FOUND
 
+# Only re-issue SET search_path when the tenant (or connection) changes
+TENANT_LIMIT_SET_CALLS = CORE_TENANT_LIMIT_SET_CALLS
+
+# Cache hostname -> tenant resolutions (see app.middleware_tenant_cache)
+TENANT_CACHE_TIMEOUT = env.int("TENANT_CACHE_TIMEOUT", default=CORE_TENANT_CACHE_TIMEOUT)
+
 SHARED_APPS: tuple[str, ...] = tuple(get_shared_apps())
 TENANT_APPS: tuple[str, ...] = tuple(get_tenant_apps())
 
-# Final INSTALLED_APPS resolved through the core registry (shared first, deduped)
+# Final INSTALLED_APPS resolved through the core registry (shared first, deduped,
+# precomputed unless extra apps were registered)
 INSTALLED_APPS = get_installed_apps()
 
+# "full" (default) serves static files itself via WhiteNoise; "api" processes sit
+# behind a proxy that serves /static/, so staticfiles and WhiteNoise are dropped.
+# collectstatic (image build) and the admin-serving process must run as "full".
+APP_TYPE = env("APP_TYPE", default="full")
+if APP_TYPE == "api":
+    SHARED_APPS = tuple(app for app in SHARED_APPS if app not in STATIC_SERVING_APPS)
+    INSTALLED_APPS = tuple(app for app in INSTALLED_APPS if app not in STATIC_SERVING_APPS)
+
 DATABASE_ROUTERS = CORE_DATABASE_ROUTERS
 
 # Use separate URLConfs for public (root schema) vs tenant schemas
@@ -76,7 +100,9 @@ ROOT_URLCONF = "app.urls_tenant"
 # Middleware
 # -------------------------------------------------------------------
 # Resolved dynamically so modules can register additional middleware entries.
-MIDDLEWARE = list(get_middleware())
+MIDDLEWARE: tuple[str, ...] = tuple(get_middleware())
+if APP_TYPE == "api":
+    MIDDLEWARE = tuple(entry for entry in MIDDLEWARE if entry not in STATIC_SERVING_MIDDLEWARE)
 
 # -------------------------------------------------------------------
 # Templates
@@ -98,11 +124,11 @@ TEMPLATES = [
 
 WSGI_APPLICATION = "app.wsgi.application"
 
+# Persistent connections (CONN_MAX_AGE / CONN_HEALTH_CHECKS) are set per database
+# from DB_CONN_MAX_AGE / DB_CONN_HEALTH_CHECKS; DB_POOL=True switches postgres to a
+# psycopg connection pool instead.
 DATABASES = build_default_database_config()
 
-# Connection pooling
-CONN_MAX_AGE = env.int("DB_CONN_MAX_AGE", default=600)
-
 # -------------------------------------------------------------------
 # Password Validation
 # -------------------------------------------------------------------
@@ -150,24 +176,26 @@ USE_TZ = True
 # -------------------------------------------------------------------
 STATIC_URL = "static/"
 STATIC_ROOT = BASE_DIR / "staticfiles"
-STATICFILES_STORAGE = "whitenoise.storage.CompressedManifestStaticFilesStorage"
+# Hashed filenames + manifest; gzip/brotli variants are produced by the image build
+# (see Dockerfile) rather than inside collectstatic, and WhiteNoise serves them as-is.
+STORAGES = {
+    "default": {"BACKEND": "django.core.files.storage.FileSystemStorage"},
+    "staticfiles": {"BACKEND": "django.contrib.staticfiles.storage.ManifestStaticFilesStorage"},
+}
 
 # -------------------------------------------------------------------
 # Default Primary Key Field Type
 # -------------------------------------------------------------------
 DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
 
+# The builders return dicts keyed by setting name; bind them in one update each.
 celery_config = build_celery_config(env, timezone=TIME_ZONE)
-REDIS_URL = celery_config["REDIS_URL"]
-CELERY_BROKER_URL = celery_config["CELERY_BROKER_URL"]
-CELERY_RESULT_BACKEND = celery_config["CELERY_RESULT_BACKEND"]
-CELERY_TIMEZONE = celery_config["CELERY_TIMEZONE"]
-CELERY_TASK_TRACK_STARTED = celery_config["CELERY_TASK_TRACK_STARTED"]
-CELERY_TASK_ALWAYS_EAGER = celery_config["CELERY_TASK_ALWAYS_EAGER"]
-CELERY_ACCEPT_CONTENT = celery_config["CELERY_ACCEPT_CONTENT"]
-CELERY_TASK_SERIALIZER = celery_config["CELERY_TASK_SERIALIZER"]
-CELERY_RESULT_SERIALIZER = celery_config["CELERY_RESULT_SERIALIZER"]
-CELERY_BEAT_SCHEDULE = celery_config["CELERY_BEAT_SCHEDULE"]
+globals().update(celery_config)
+
+# -------------------------------------------------------------------
+# Cache (Redis, shared by every worker process)
+# -------------------------------------------------------------------
+CACHES = build_cache_config(env, redis_url=celery_config["REDIS_URL"])
 
 # Grace period before re-enqueuing endpoint pings
 PENDING_REQUEUE_GRACE_SECONDS = env.int("PENDING_REQUEUE_GRACE_SECONDS", default=90)
@@ -175,6 +203,7 @@ PENDING_REQUEUE_GRACE_SECONDS = env.int("PENDING_REQUEUE_GRACE_SECONDS", default
 # -------------------------------------------------------------------
 # Stripe Payment Configuration
 # -------------------------------------------------------------------
+# Bound by name so settings_production can validate them and type checkers see them.
 stripe_config = build_stripe_config(env)
 STRIPE_PUBLIC_KEY = stripe_config["STRIPE_PUBLIC_KEY"]
 STRIPE_SECRET_KEY = stripe_config["STRIPE_SECRET_KEY"]
@@ -191,8 +220,8 @@ ADMIN_URL = env("ADMIN_URL", default="admin/")
 # -------------------------------------------------------------------
 REST_FRAMEWORK = build_rest_framework_config()
 
-# Feature flag to disable DRF throttling in selected environments
-API_RATE_LIMITING_ENABLED = env.bool("API_RATE_LIMITING_ENABLED", default=True)
+# API_RATE_LIMITING_ENABLED (DRF throttling feature flag) and FRONTEND_URL are
+# environment-specific and defined once in settings_development/settings_production.
 
 # -------------------------------------------------------------------
 # JWT Configuration
@@ -203,17 +232,12 @@ SIMPLE_JWT = build_simple_jwt_defaults()
 # -------------------------------------------------------------------
 # Email Configuration (base settings)
 # -------------------------------------------------------------------
-_email_defaults = build_email_defaults(env)
-EMAIL_HOST = _email_defaults["EMAIL_HOST"]
-EMAIL_PORT = _email_defaults["EMAIL_PORT"]
-EMAIL_USE_TLS = _email_defaults["EMAIL_USE_TLS"]
-EMAIL_HOST_USER = _email_defaults["EMAIL_HOST_USER"]
-EMAIL_HOST_PASSWORD = _email_defaults["EMAIL_HOST_PASSWORD"]
-DEFAULT_FROM_EMAIL = _email_defaults["DEFAULT_FROM_EMAIL"]
-SERVER_EMAIL = _email_defaults["SERVER_EMAIL"]
-FRONTEND_URL = _email_defaults["FRONTEND_URL"]
+globals().update(build_email_defaults(env))
 
 # -------------------------------------------------------------------
 # Logging Configuration (shared base)
 # -------------------------------------------------------------------
-LOGGING = build_logging_config()
+# Above WARNING the CORS logging middleware skips its per-request work entirely.
+LOGGING = build_logging_config(
+    cors_debug_level=env("CORS_DEBUG_LOG_LEVEL", default="WARNING").upper()
+)
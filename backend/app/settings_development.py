@@ -5,16 +5,18 @@ Optimized for local development with relaxed security and verbose logging.
 """
 
 from modules.core.settings import (
+    build_jwt_signing_config,
     configure_sentry,
     get_dev_cors_settings,
     get_dev_csrf_trusted_origins,
     get_dev_https_settings,
     get_dev_security_headers,
+    get_env_snapshot,
     get_permissions_policy,
+    get_permissions_policy_header,
 )
 
 from app.settings_base import *  # noqa: F403, F401
-from app.settings_base import env  # noqa: F401
 
 # -------------------------------------------------------------------
 # Core Development Settings
@@ -23,9 +25,9 @@ DEBUG = True
 
 # Disable DRF throttling for local development to keep test runs fast.
 # CI (and pytest) still see throttles unless explicitly disabled via env.
-API_RATE_LIMITING_ENABLED = env.bool(
+API_RATE_LIMITING_ENABLED = env.bool(  # noqa: F405
     "API_RATE_LIMITING_ENABLED",
-    default=env.bool("CI", default=False),
+    default=env.bool("CI", default=False),  # noqa: F405
 )
 
 # Required for JWT signing
@@ -54,13 +56,13 @@ DEFAULT_TENANT_DOMAIN_SUFFIX = env(  # noqa: F405
 # -------------------------------------------------------------------
 # JWT Configuration (Development)
 # -------------------------------------------------------------------
-SIMPLE_JWT["SIGNING_KEY"] = SECRET_KEY  # noqa: F405
+SIMPLE_JWT.update(build_jwt_signing_config(SECRET_KEY))  # noqa: F405
 
 # -------------------------------------------------------------------
 # CORS Configuration (Development - Permissive)
 # -------------------------------------------------------------------
 # Apply shared dev defaults so origin lists stay consistent across environments.
-globals().update(get_dev_cors_settings(env))  # noqa: F405
+globals().update(get_dev_cors_settings(get_env_snapshot()))
 
 # -------------------------------------------------------------------
 # CSRF Configuration (Development)
@@ -77,6 +79,16 @@ globals().update(get_dev_https_settings())
 # -------------------------------------------------------------------
 globals().update(get_dev_security_headers())
 PERMISSIONS_POLICY = get_permissions_policy()
+# Header values rendered once here; SecurityHeadersMiddleware sends them verbatim.
+PERMISSIONS_POLICY_HEADER = get_permissions_policy_header()
+
+# -------------------------------------------------------------------
+# Static Files (Development - No Manifest)
+# -------------------------------------------------------------------
+# Serve unhashed files so runserver/tests work without running collectstatic first.
+STORAGES["staticfiles"] = {  # noqa: F405
+    "BACKEND": "django.contrib.staticfiles.storage.StaticFilesStorage"
+}
 
 # -------------------------------------------------------------------
 # Email Configuration (Development - Console Backend)
@@ -102,12 +114,18 @@ FRONTEND_URL = env("FRONTEND_URL", default="https://localhost:5173")  # noqa: F4
 # -------------------------------------------------------------------
 # Override monitors.audit logger to DEBUG level for development
 LOGGING["loggers"]["monitors.audit"]["level"] = "DEBUG"  # type: ignore  # noqa: F405
+# Full CORS request/response tracing in development unless the env says otherwise
+LOGGING["loggers"]["cors_debug"]["level"] = env(  # type: ignore  # noqa: F405
+    "CORS_DEBUG_LOG_LEVEL", default="DEBUG"
+).upper()
 
 # -------------------------------------------------------------------
 # Development-Specific Settings
 # -------------------------------------------------------------------
 # No Stripe validation in development (allow empty keys for testing)
-_sentry_cfg = configure_sentry(env, default_environment="development")  # noqa: F405
+_sentry_cfg = configure_sentry(  # noqa: F405
+    env, default_environment="development", debug=DEBUG  # noqa: F405
+)
 SENTRY_DSN = _sentry_cfg["dsn"]
 SENTRY_TRACES_SAMPLE_RATE = _sentry_cfg["traces_sample_rate"]
 if "environment" in _sentry_cfg:
@@ -7,12 +7,17 @@ Optimized for production deployment with strict security and validation.
 import sys
 
 from modules.core.settings import (
+    build_jwt_signing_config,
     configure_sentry,
+    get_env_snapshot,
     get_permissions_policy,
+    get_permissions_policy_header,
+    get_prod_allowed_hosts,
     get_prod_cors_settings,
     get_prod_csrf_trusted_origins,
     get_prod_https_settings,
     get_prod_security_headers,
+    validate_production_secret_key,
 )
 
 from app.settings_base import *  # noqa: F403, F401
@@ -20,45 +25,23 @@ from app.settings_base import *  # noqa: F403, F401
 # -------------------------------------------------------------------
 # Core Production Settings
 # -------------------------------------------------------------------
-DEBUG = env.bool("DEBUG", default=False)  # noqa: F405
+_env_snapshot = get_env_snapshot()
+
+DEBUG = _env_snapshot.debug
+
+# Feature flag to disable DRF throttling in selected environments
+API_RATE_LIMITING_ENABLED = env.bool("API_RATE_LIMITING_ENABLED", default=True)  # noqa: F405
 
 # -------------------------------------------------------------------
 # Secret Key Validation (Production)
 # -------------------------------------------------------------------
-SECRET_KEY = env("SECRET_KEY", default=None)  # noqa: F405
-
-if not SECRET_KEY:
-    raise ValueError(
-        "SECRET_KEY is not set. Please set it in your .env file or environment variables.\n"
-        "Generate a secure key with: python -c 'from django.core.management.utils import get_random_secret_key; print(get_random_secret_key())'"
-    )
-
-if SECRET_KEY.startswith("django-insecure"):
-    raise ValueError(
-        "Cannot use 'django-insecure' SECRET_KEY in production (DEBUG=False).\n"
-        "Generate a secure key with: python -c 'from django.core.management.utils import get_random_secret_key; print(get_random_secret_key())'"
-    )
-
-# Validate SECRET_KEY length and complexity
-if len(SECRET_KEY) < 50:
-    raise ValueError(
-        "SECRET_KEY must be at least 50 characters long in production.\n"
-        "Generate a secure key with: python -c 'from django.core.management.utils import get_random_secret_key; print(get_random_secret_key())'"
-    )
+SECRET_KEY = validate_production_secret_key(env("SECRET_KEY", default=None))  # noqa: F405
 
 # -------------------------------------------------------------------
 # Allowed Hosts (Production - Strict)
 # -------------------------------------------------------------------
 # Must be explicitly set in production
-ALLOWED_HOSTS = env.list(  # noqa: F405
-    "ALLOWED_HOSTS",
-    default=[
-        "django-01.local",
-        ".django-01.local",
-        "statuswatch.local",
-        ".statuswatch.local",
-    ],
-)
+ALLOWED_HOSTS = get_prod_allowed_hosts(env)  # noqa: F405
 
 # -------------------------------------------------------------------
 # Tenant Domain Configuration (Production)
@@ -72,7 +55,7 @@ DEFAULT_TENANT_DOMAIN_SUFFIX = env(  # noqa: F405
 # -------------------------------------------------------------------
 # JWT Configuration (Production)
 # -------------------------------------------------------------------
-SIMPLE_JWT["SIGNING_KEY"] = SECRET_KEY  # noqa: F405
+SIMPLE_JWT.update(build_jwt_signing_config(SECRET_KEY))  # noqa: F405
 
 # -------------------------------------------------------------------
 # CORS Configuration (Production - Strict)
@@ -87,30 +70,34 @@ CSRF_TRUSTED_ORIGINS = get_prod_csrf_trusted_origins(env)  # noqa: F405
 # -------------------------------------------------------------------
 # HTTPS/Security Configuration (Production - Strict)
 # -------------------------------------------------------------------
-globals().update(get_prod_https_settings(env))  # noqa: F405
+globals().update(get_prod_https_settings(_env_snapshot))
 
 # -------------------------------------------------------------------
 # Security Headers (Production - Strict)
 # -------------------------------------------------------------------
 globals().update(get_prod_security_headers())
 PERMISSIONS_POLICY = get_permissions_policy()
+# Header values rendered once here; SecurityHeadersMiddleware sends them verbatim.
+PERMISSIONS_POLICY_HEADER = get_permissions_policy_header()
 
 # -------------------------------------------------------------------
 # Stripe Validation (Production)
 # -------------------------------------------------------------------
 # Skip validation for management commands that don't need Stripe
-management_commands_skip_validation = [
-    "makemigrations",
-    "migrate",
-    "shell",
-    "dbshell",
-    "showmigrations",
-    "sqlmigrate",
-    "createsuperuser",
-    "collectstatic",
-]
-
-should_validate = not any(cmd in sys.argv for cmd in management_commands_skip_validation)
+management_commands_skip_validation = frozenset(
+    {
+        "makemigrations",
+        "migrate",
+        "shell",
+        "dbshell",
+        "showmigrations",
+        "sqlmigrate",
+        "createsuperuser",
+        "collectstatic",
+    }
+)
+
+should_validate = management_commands_skip_validation.isdisjoint(sys.argv)
 
 if should_validate:
     if not STRIPE_PUBLIC_KEY or not STRIPE_PUBLIC_KEY.startswith("pk_"):  # noqa: F405
@@ -136,10 +123,12 @@ EMAIL_BACKEND = env(  # noqa: F405
     "EMAIL_BACKEND", default="django.core.mail.backends.smtp.EmailBackend"
 )
 
+FRONTEND_URL = env("FRONTEND_URL", default="")  # noqa: F405
+
 # -------------------------------------------------------------------
 # Sentry Configuration (Production - Error & Performance Monitoring)
 # -------------------------------------------------------------------
-_sentry_cfg = configure_sentry(env)  # noqa: F405
+_sentry_cfg = configure_sentry(env, debug=DEBUG)  # noqa: F405
 SENTRY_DSN = _sentry_cfg["dsn"]
 SENTRY_TRACES_SAMPLE_RATE = _sentry_cfg["traces_sample_rate"]
 if "environment" in _sentry_cfg:
@@ -4,11 +4,13 @@ from __future__ import annotations
 
 import datetime
 import logging
+import time
 from dataclasses import dataclass
 from typing import Any
 
 from api.auth_service import MultiTenantAuthenticationError, MultiTenantAuthService
 from django.conf import settings
+from django.core.cache import cache
 from django.db import connection
 from django.utils import timezone
 from rest_framework_simplejwt.exceptions import TokenError
@@ -16,6 +18,63 @@ from rest_framework_simplejwt.tokens import RefreshToken
 
 logger = logging.getLogger("api.auth")
 
+BLACKLIST_CACHE_KEY = "jwt:bl:{jti}"
+REFRESH_LOCK_CACHE_KEY = "jwt:refresh:lock:{jti}"
+REFRESH_LOCK_TIMEOUT = 10
+
+
+def cache_blacklisted_jti(jti: str | None, exp: float | None) -> None:
+    """Mark a refresh token as revoked in the cache until it would expire anyway."""
+
+    if not jti or not exp:
+        return
+    ttl = int(exp - time.time())
+    if ttl > 0:
+        cache.set(BLACKLIST_CACHE_KEY.format(jti=jti), True, timeout=ttl)
+
+
+def is_jti_blacklisted_in_cache(jti: str | None) -> bool:
+    """Return True when a logout has revoked this JTI but the DB row may not exist yet."""
+
+    if not jti:
+        return False
+    try:
+        return cache.get(BLACKLIST_CACHE_KEY.format(jti=jti)) is not None
+    except Exception:
+        # The DB blacklist still applies; only the window before the row lands is lost.
+        logger.warning("Revocation cache unavailable, skipping cached blacklist check")
+        return False
+
+
+def acquire_refresh_lock(jti: str | None) -> bool:
+    """
+    Claim the right to refresh this JTI.
+
+    cache.add only succeeds when the key is absent, so concurrent refreshes of the
+    same token (client retry storms) cannot both rotate it. The timeout bounds how
+    long a crashed worker can hold the lock. If the cache is unreachable the
+    refresh goes ahead unlocked rather than failing.
+    """
+
+    if not jti:
+        return True
+    try:
+        return cache.add(REFRESH_LOCK_CACHE_KEY.format(jti=jti), True, timeout=REFRESH_LOCK_TIMEOUT)
+    except Exception:
+        logger.warning("Refresh lock cache unavailable, refreshing without a lock")
+        return True
+
+
+def release_refresh_lock(jti: str | None) -> None:
+    """Drop the lock taken by acquire_refresh_lock; never raises, it runs in a finally."""
+
+    if not jti:
+        return
+    try:
+        cache.delete(REFRESH_LOCK_CACHE_KEY.format(jti=jti))
+    except Exception:
+        logger.warning("Refresh lock cache unavailable, lock left to expire")
+
 
 @dataclass(slots=True)
 class TokenRefreshResult:
@@ -55,16 +114,31 @@ class TenantAuthService:
 
     @staticmethod
     def refresh_tokens(
-        refresh_token: str,
+        refresh_token: str | RefreshToken,
         *,
         token_class: type[RefreshToken] = RefreshToken,
     ) -> TokenRefreshResult:
-        """Validate and rotate refresh tokens in the public schema."""
-
-        try:
-            token = token_class(refresh_token)
-        except TokenError as exc:  # Bubble up as custom error for the API view
-            raise TokenRefreshError(str(exc)) from exc
+        """Validate and rotate refresh tokens in the public schema.
+
+        Accepts either the raw token string or an already-verified ``RefreshToken``
+        so callers that decoded the token themselves do not pay for a second decode.
+        """
+
+        raw_token: str
+        if isinstance(refresh_token, str):
+            try:
+                # simplejwt annotates the encoded token parameter as Token | None.
+                token = token_class(refresh_token)  # type: ignore[arg-type]
+            except TokenError as exc:  # Bubble up as custom error for the API view
+                raise TokenRefreshError(str(exc)) from exc
+            raw_token = refresh_token
+        else:
+            token = refresh_token
+            # .token holds the string the caller decoded; unsigned tokens are encoded here.
+            raw_token = token.token if isinstance(token.token, str) else str(token)
+
+        if is_jti_blacklisted_in_cache(token.get("jti")):
+            raise TokenRefreshError("Token is blacklisted")
 
         jwt_config = getattr(settings, "SIMPLE_JWT", {})
         rotate_tokens = jwt_config.get("ROTATE_REFRESH_TOKENS", False)
@@ -96,7 +170,7 @@ class TenantAuthService:
                         token_obj, _ = OutstandingToken.objects.get_or_create(
                             jti=old_jti,
                             defaults={
-                                "token": refresh_token,
+                                "token": raw_token,
                                 "created_at": timezone.now(),
                                 "expires_at": expires_at,
                                 "user": None,
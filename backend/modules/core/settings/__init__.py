@@ -7,24 +7,37 @@ module rather than duplicating logic.
 
 from __future__ import annotations
 
+import logging
+import os
 from collections.abc import Mapping
 from datetime import timedelta
+from functools import cache
 from pathlib import Path
 from typing import Any
+from urllib.parse import urlsplit
 
 import environ
 
-from modules.core.settings.logger import SettingsLoggingContext, setup_settings_logging
+from modules.core.settings.environment import EnvSnapshot
+from modules.core.settings.logger import (
+    BASE_DIR,
+    LOG_DIR,
+    SettingsLoggingContext,
+    setup_settings_logging,
+)
 from modules.core.settings.security import (
     get_dev_cors_settings,
     get_dev_csrf_trusted_origins,
     get_dev_https_settings,
     get_dev_security_headers,
     get_permissions_policy,
+    get_permissions_policy_header,
+    get_prod_allowed_hosts,
     get_prod_cors_settings,
     get_prod_csrf_trusted_origins,
     get_prod_https_settings,
     get_prod_security_headers,
+    validate_production_secret_key,
 )
 from modules.core.settings.sentry import configure_sentry
 from modules.core.settings_registry import (
@@ -37,17 +50,48 @@ from modules.core.settings_registry import (
 # ---------------------------------------------------------------------------
 # Base directories / env loader
 # ---------------------------------------------------------------------------
-# Path(__file__) -> backend/modules/core/settings/__init__.py; backend lives three levels up
-BASE_DIR = Path(__file__).resolve().parents[3]
-LOG_DIR = BASE_DIR / "logs"
-LOG_DIR.mkdir(exist_ok=True)
+# BASE_DIR / LOG_DIR are shared with the settings logger, which needs them first.
+# LOG_DIR is created by setup_settings_logging(), which every entrypoint runs before settings.
+ENV_FILE_CANDIDATES = (BASE_DIR / ".env", BASE_DIR.parent / ".env")
+
+
+class _TenantsEnv(environ.Env):
+    """environ.Env whose postgres URL schemes resolve straight to the django-tenants backend."""
+
+    DB_SCHEMES = {
+        **environ.Env.DB_SCHEMES,
+        **dict.fromkeys(
+            ("postgres", "postgresql", "psql", "pgsql"), "django_tenants.postgresql_backend"
+        ),
+    }
+
+
+_env = _TenantsEnv()
+
+
+@cache
+def load_env_file() -> Path | None:
+    """
+    Read the first existing .env candidate into os.environ, once per process.
+
+    DJANGO_ENV_FILE names the file explicitly and skips probing the candidates.
+    Runs at import; with gunicorn --preload (and Celery's prefork pool) that is the
+    master, so forked workers inherit the parsed environment instead of re-reading it.
+    """
+
+    explicit = os.environ.get("DJANGO_ENV_FILE")
+    if explicit:
+        environ.Env.read_env(explicit)
+        return Path(explicit)
+
+    for candidate in ENV_FILE_CANDIDATES:
+        if candidate.exists():
+            environ.Env.read_env(candidate)
+            return candidate
+    return None
+
 
-_env = environ.Env()
-_env_file = BASE_DIR / ".env"
-if not _env_file.exists():
-    _env_file = BASE_DIR.parent / ".env"
-if _env_file.exists():
-    environ.Env.read_env(_env_file)
+load_env_file()
 
 
 def get_env() -> environ.Env:
@@ -56,6 +100,13 @@ def get_env() -> environ.Env:
     return _env
 
 
+@cache
+def get_env_snapshot() -> EnvSnapshot:
+    """Return the process-wide EnvSnapshot, cast from the environment on first use."""
+
+    return EnvSnapshot.from_env(_env)
+
+
 # ---------------------------------------------------------------------------
 # Tenancy configuration
 # ---------------------------------------------------------------------------
@@ -64,9 +115,22 @@ DOMAIN_MODEL = "tenants.Domain"
 TENANT_DOMAIN_MODEL = "tenants.Domain"
 PUBLIC_SCHEMA_NAME = "public"
 SHOW_PUBLIC_IF_NO_TENANT_FOUND = True
+# Issue SET search_path once per connection/tenant switch instead of before every
+# cursor; django-tenants resets it on set_tenant() and on connection close.
+TENANT_LIMIT_SET_CALLS = True
+# Seconds a hostname -> tenant resolution stays in the cache (0 disables caching)
+TENANT_CACHE_TIMEOUT = 3600
 DATABASE_ROUTERS = ("django_tenants.routers.TenantSyncRouter",)
 
 
+# ---------------------------------------------------------------------------
+# Process type
+# ---------------------------------------------------------------------------
+# APP_TYPE=api processes only serve the JSON API; the fronting proxy serves
+# /static/ from the collected files, so these entries are left out there.
+STATIC_SERVING_APPS = frozenset({"django.contrib.staticfiles"})
+STATIC_SERVING_MIDDLEWARE = frozenset({"whitenoise.middleware.WhiteNoiseMiddleware"})
+
 # ---------------------------------------------------------------------------
 # Settings fragments
 # ---------------------------------------------------------------------------
@@ -74,12 +138,23 @@ DATABASE_ROUTERS = ("django_tenants.routers.TenantSyncRouter",)
 
 def build_default_database_config() -> dict[str, Any]:
     env = get_env()
+    # Single parse: postgres schemes map to the django-tenants engine via _TenantsEnv.
     database = env.db("DATABASE_URL", default=f"sqlite:///{BASE_DIR / 'db.sqlite3'}")
-    if database["ENGINE"] in (
-        "django.db.backends.postgresql",
-        "django.db.backends.postgresql_psycopg2",
-    ):
-        database["ENGINE"] = "django_tenants.postgresql_backend"
+    # Persistent connections: reuse the socket across requests (schema switches are
+    # just `SET search_path`) and ping it before reuse so stale connections are dropped.
+    snapshot = get_env_snapshot()
+    database["CONN_MAX_AGE"] = snapshot.db_conn_max_age
+    database["CONN_HEALTH_CHECKS"] = snapshot.db_conn_health_checks
+    if snapshot.db_pool and database["ENGINE"] == "django_tenants.postgresql_backend":
+        # psycopg3 pool: workers borrow warm connections instead of each pinning one,
+        # which keeps the Postgres connection count bounded under burst traffic.
+        # Django refuses persistent connections alongside a pool, so CONN_MAX_AGE is 0.
+        database.setdefault("OPTIONS", {})["pool"] = {
+            "min_size": snapshot.db_pool_min_size,
+            "max_size": snapshot.db_pool_max_size,
+            "timeout": snapshot.db_pool_timeout,
+        }
+        database["CONN_MAX_AGE"] = 0
     return {"default": database}
 
 
@@ -89,6 +164,11 @@ def build_rest_framework_config() -> dict[str, Any]:
             "rest_framework_simplejwt.authentication.JWTAuthentication",
             "rest_framework.authentication.SessionAuthentication",
         ),
+        # orjson (C) serializes the small auth/API payloads much faster than stdlib json.
+        "DEFAULT_RENDERER_CLASSES": (
+            "api.renderers.StatusWatchJSONRenderer",
+            "rest_framework.renderers.BrowsableAPIRenderer",
+        ),
         "EXCEPTION_HANDLER": "api.exception_handler.custom_exception_handler",
         "DEFAULT_PAGINATION_CLASS": "rest_framework.pagination.PageNumberPagination",
         "PAGE_SIZE": 50,
@@ -104,10 +184,18 @@ def build_rest_framework_config() -> dict[str, Any]:
     }
 
 
+# Token lifetimes and beat intervals, built once and shared by reference.
+ACCESS_TOKEN_LIFETIME = timedelta(minutes=15)
+REFRESH_TOKEN_LIFETIME = timedelta(days=7)
+SLIDING_TOKEN_LIFETIME = timedelta(minutes=5)
+SLIDING_TOKEN_REFRESH_LIFETIME = timedelta(days=1)
+ENDPOINT_CHECK_SCHEDULE = timedelta(minutes=1)
+
+
 def build_simple_jwt_defaults() -> dict[str, Any]:
     return {
-        "ACCESS_TOKEN_LIFETIME": timedelta(minutes=15),
-        "REFRESH_TOKEN_LIFETIME": timedelta(days=7),
+        "ACCESS_TOKEN_LIFETIME": ACCESS_TOKEN_LIFETIME,
+        "REFRESH_TOKEN_LIFETIME": REFRESH_TOKEN_LIFETIME,
         "ROTATE_REFRESH_TOKENS": True,
         "BLACKLIST_AFTER_ROTATION": True,
         "UPDATE_LAST_LOGIN": True,
@@ -119,12 +207,54 @@ def build_simple_jwt_defaults() -> dict[str, Any]:
         "AUTH_TOKEN_CLASSES": ("rest_framework_simplejwt.tokens.AccessToken",),
         "TOKEN_TYPE_CLAIM": "token_type",
         "SLIDING_TOKEN_REFRESH_EXP_CLAIM": "refresh_exp",
-        "SLIDING_TOKEN_LIFETIME": timedelta(minutes=5),
-        "SLIDING_TOKEN_REFRESH_LIFETIME": timedelta(days=1),
+        "SLIDING_TOKEN_LIFETIME": SLIDING_TOKEN_LIFETIME,
+        "SLIDING_TOKEN_REFRESH_LIFETIME": SLIDING_TOKEN_REFRESH_LIFETIME,
+    }
+
+
+def _file_handler(
+    path: Path,
+    level: str = "INFO",
+    filters: tuple[str, ...] = (),
+    *,
+    formatter: str = "verbose",
+) -> dict[str, Any]:
+    """Return the dictConfig entry shared by every per-topic log file."""
+
+    handler = {
+        "level": level,
+        # web, worker and beat all append to these files, so rotation is left to
+        # logrotate (see statuswatch.logrotate); the handler reopens the file once
+        # it has been moved aside.
+        "class": "logging.handlers.WatchedFileHandler",
+        "filename": path,
+        # Open the file on the first emitted record, so short-lived commands
+        # (check, showmigrations, ...) never touch log files they don't write.
+        "delay": True,
+        # Records carry non-ASCII text (e.g. tenant names); don't depend on the locale.
+        "encoding": "utf-8",
+        "formatter": formatter,
     }
+    if filters:
+        handler["filters"] = list(filters)
+    return handler
 
 
-def build_logging_config(log_dir: Path | None = None) -> dict[str, Any]:
+def _queued_handler(target: str, level: str = "INFO") -> dict[str, Any]:
+    """Return a queue handler whose listener thread forwards records to ``target``."""
+
+    return {
+        "level": level,
+        "class": "app.logging_handlers.BackgroundQueueHandler",
+        "queue": "queue.SimpleQueue",
+        "handlers": [target],
+        "respect_handler_level": True,
+    }
+
+
+def build_logging_config(
+    log_dir: Path | None = None, *, cors_debug_level: str = "WARNING"
+) -> dict[str, Any]:
     dir_path = log_dir or LOG_DIR
     return {
         "version": 1,
@@ -138,6 +268,11 @@ def build_logging_config(log_dir: Path | None = None) -> dict[str, Any]:
                 "format": "[{levelname}] {message}",
                 "style": "{",
             },
+            "cors": {
+                "format": "{asctime} [{levelname}] {message}",
+                "datefmt": "%Y-%m-%d %H:%M:%S",
+                "style": "{",
+            },
         },
         "filters": {
             "require_debug_false": {"()": "django.utils.log.RequireDebugFalse"},
@@ -150,105 +285,99 @@ def build_logging_config(log_dir: Path | None = None) -> dict[str, Any]:
                 "class": "logging.StreamHandler",
                 "formatter": "verbose",
             },
+            # Loggers write to the console through this queue; a background listener
+            # thread does the blocking stderr writes off the request thread.
+            "console_queued": _queued_handler("console"),
             "console_debug": {
                 "level": "DEBUG",
                 "filters": ["require_debug_true"],
                 "class": "logging.StreamHandler",
                 "formatter": "verbose",
             },
-            **{
-                name: {
-                    "level": handler_cfg["level"],
-                    "class": "logging.handlers.RotatingFileHandler",
-                    "filename": dir_path / handler_cfg["filename"],
-                    "maxBytes": handler_cfg.get("max_bytes", 1024 * 1024 * 5),
-                    "backupCount": 5,
-                    "formatter": "verbose",
-                    **({"filters": ["max_warning"]} if handler_cfg.get("filters") else {}),
-                }
-                for name, handler_cfg in {
-                    "file_app": {"level": "INFO", "filename": "statuswatch.log", "filters": True},
-                    "file_error": {"level": "ERROR", "filename": "error.log"},
-                    "file_security": {"level": "WARNING", "filename": "security.log"},
-                    "file_request": {"level": "INFO", "filename": "request.log"},
-                    "file_audit": {"level": "INFO", "filename": "audit.log"},
-                    "file_performance": {"level": "INFO", "filename": "performance.log"},
-                    "file_payments": {"level": "INFO", "filename": "payments.log"},
-                    "file_billing": {"level": "INFO", "filename": "billing.log"},
-                    "file_webhooks": {"level": "INFO", "filename": "webhooks.log"},
-                    "file_webhooks_debug": {"level": "DEBUG", "filename": "webhooks_debug.log"},
-                    "file_webhook_signatures": {
-                        "level": "INFO",
-                        "filename": "webhook_signatures.log",
-                    },
-                    "file_subscriptions": {"level": "INFO", "filename": "subscriptions.log"},
-                    "file_cancellations": {"level": "INFO", "filename": "cancellations.log"},
-                    "file_subscription_state": {
-                        "level": "INFO",
-                        "filename": "subscription_state.log",
-                    },
-                    "file_authentication": {"level": "INFO", "filename": "authentication.log"},
-                    "file_health": {
-                        "level": "INFO",
-                        "filename": "health.log",
-                        "max_bytes": 1024 * 1024 * 10,
-                    },
-                    "file_frontend_resolution": {
-                        "level": "INFO",
-                        "filename": "frontend_resolution.log",
-                        "max_bytes": 1024 * 1024 * 10,
-                    },
-                }.items()
+            # Per-request access records are written to request.log in batches of 100;
+            # an ERROR record (or shutdown) flushes immediately.
+            "file_request_buffered": {
+                "level": "INFO",
+                "class": "logging.handlers.MemoryHandler",
+                "capacity": 100,
+                "flushLevel": logging.ERROR,
+                "target": "file_request",
             },
+            # Per-request / per-check loggers hand records to a listener thread that owns
+            # the file writes (and, for request.log, the batching above).
+            "file_request_queued": _queued_handler("file_request_buffered"),
+            "file_audit_queued": _queued_handler("file_audit"),
+            "file_performance_queued": _queued_handler("file_performance"),
+            "file_cors_debug_queued": _queued_handler("file_cors_debug", "DEBUG"),
+            "file_app": _file_handler(dir_path / "statuswatch.log", filters=("max_warning",)),
+            "file_error": _file_handler(dir_path / "error.log", "ERROR"),
+            "file_security": _file_handler(dir_path / "security.log", "WARNING"),
+            "file_request": _file_handler(dir_path / "request.log"),
+            "file_audit": _file_handler(dir_path / "audit.log"),
+            "file_performance": _file_handler(dir_path / "performance.log"),
+            "file_payments": _file_handler(dir_path / "payments.log"),
+            "file_billing": _file_handler(dir_path / "billing.log"),
+            "file_webhooks": _file_handler(dir_path / "webhooks.log"),
+            "file_webhooks_debug": _file_handler(dir_path / "webhooks_debug.log", "DEBUG"),
+            "file_webhook_signatures": _file_handler(dir_path / "webhook_signatures.log"),
+            "file_subscriptions": _file_handler(dir_path / "subscriptions.log"),
+            "file_cancellations": _file_handler(dir_path / "cancellations.log"),
+            "file_subscription_state": _file_handler(dir_path / "subscription_state.log"),
+            "file_authentication": _file_handler(dir_path / "authentication.log"),
+            "file_health": _file_handler(dir_path / "health.log"),
+            "file_frontend_resolution": _file_handler(dir_path / "frontend_resolution.log"),
+            "file_cors_debug": _file_handler(
+                dir_path / "cors_debug.log", "DEBUG", formatter="cors"
+            ),
         },
         "loggers": {
             "django": {
-                "handlers": ["console", "file_app", "file_error"],
+                "handlers": ["console_queued", "file_app", "file_error"],
                 "level": "INFO",
                 "propagate": False,
             },
             "django.security": {
-                "handlers": ["file_security", "console"],
+                "handlers": ["file_security", "console_queued"],
                 "level": "WARNING",
                 "propagate": False,
             },
             "django.request": {
-                "handlers": ["file_app", "file_error", "console"],
+                "handlers": ["file_app", "file_error", "console_queued"],
                 "level": "ERROR",
                 "propagate": False,
             },
             "api": {
-                "handlers": ["console", "file_app"],
+                "handlers": ["console_queued", "file_app"],
                 "level": "INFO",
                 "propagate": False,
             },
             "tenants": {
-                "handlers": ["console", "file_app"],
+                "handlers": ["console_queued", "file_app"],
                 "level": "INFO",
                 "propagate": False,
             },
             "tenant.routing": {
-                "handlers": ["console", "file_app"],
+                "handlers": ["console_queued", "file_app"],
                 "level": "INFO",
                 "propagate": False,
             },
             "payments": {
-                "handlers": ["console", "file_app"],
+                "handlers": ["console_queued", "file_app"],
                 "level": "INFO",
                 "propagate": False,
             },
             "payments.checkout": {
-                "handlers": ["console", "file_payments"],
+                "handlers": ["console_queued", "file_payments"],
                 "level": "INFO",
                 "propagate": False,
             },
             "payments.billing": {
-                "handlers": ["console", "file_billing"],
+                "handlers": ["console_queued", "file_billing"],
                 "level": "INFO",
                 "propagate": False,
             },
             "payments.webhooks": {
-                "handlers": ["console", "file_webhooks"],
+                "handlers": ["console_queued", "file_webhooks"],
                 "level": "INFO",
                 "propagate": False,
             },
@@ -263,7 +392,7 @@ def build_logging_config(log_dir: Path | None = None) -> dict[str, Any]:
                 "propagate": False,
             },
             "payments.subscriptions": {
-                "handlers": ["console", "file_subscriptions"],
+                "handlers": ["console_queued", "file_subscriptions"],
                 "level": "INFO",
                 "propagate": False,
             },
@@ -273,7 +402,7 @@ def build_logging_config(log_dir: Path | None = None) -> dict[str, Any]:
                 "propagate": False,
             },
             "payments.cancellations": {
-                "handlers": ["console", "file_cancellations"],
+                "handlers": ["console_queued", "file_cancellations"],
                 "level": "INFO",
                 "propagate": False,
             },
@@ -283,7 +412,7 @@ def build_logging_config(log_dir: Path | None = None) -> dict[str, Any]:
                 "propagate": False,
             },
             "api.auth": {
-                "handlers": ["console", "file_authentication", "file_security"],
+                "handlers": ["console_queued", "file_authentication", "file_security"],
                 "level": "INFO",
                 "propagate": False,
             },
@@ -292,13 +421,18 @@ def build_logging_config(log_dir: Path | None = None) -> dict[str, Any]:
                 "level": "INFO",
                 "propagate": False,
             },
+            "api.requests": {
+                "handlers": ["file_request_queued"],
+                "level": "INFO",
+                "propagate": False,
+            },
             "api.audit": {
-                "handlers": ["file_audit", "console"],
+                "handlers": ["file_audit", "console_queued"],
                 "level": "INFO",
                 "propagate": False,
             },
             "api.performance": {
-                "handlers": ["file_performance", "console"],
+                "handlers": ["file_performance_queued", "console_queued"],
                 "level": "WARNING",
                 "propagate": False,
             },
@@ -308,28 +442,34 @@ def build_logging_config(log_dir: Path | None = None) -> dict[str, Any]:
                 "propagate": False,
             },
             "monitors": {
-                "handlers": ["console", "file_app"],
+                "handlers": ["console_queued", "file_app"],
                 "level": "INFO",
                 "propagate": False,
             },
             "monitors.audit": {
-                "handlers": ["file_audit", "console"],
+                "handlers": ["file_audit_queued", "console_queued"],
                 "level": "INFO",
                 "propagate": False,
             },
             "monitors.performance": {
-                "handlers": ["file_performance", "console"],
+                "handlers": ["file_performance_queued", "console_queued"],
                 "level": "INFO",
                 "propagate": False,
             },
+            # Per-request CORS header trace written by app.middleware_cors_logging
+            "cors_debug": {
+                "handlers": ["file_cors_debug_queued"],
+                "level": cors_debug_level,
+                "propagate": False,
+            },
             "subscriptions.feature_gating": {
-                "handlers": ["console", "file_subscriptions"],
+                "handlers": ["console_queued", "file_subscriptions"],
                 "level": "INFO",
                 "propagate": False,
             },
         },
         "root": {
-            "handlers": ["console", "file_app"],
+            "handlers": ["console_queued", "file_app"],
             "level": "INFO",
         },
     }
@@ -346,7 +486,6 @@ def build_email_defaults(env: environ.Env | None = None) -> Mapping[str, Any]:
         "EMAIL_HOST_PASSWORD": env("EMAIL_HOST_PASSWORD", default=""),
         "DEFAULT_FROM_EMAIL": default_from,
         "SERVER_EMAIL": env("SERVER_EMAIL", default=default_from),
-        "FRONTEND_URL": env("FRONTEND_URL", default=""),
     }
 
 
@@ -367,20 +506,68 @@ def build_celery_config(
         "CELERY_BROKER_URL": celery_broker_url,
         "CELERY_RESULT_BACKEND": celery_result_backend,
         "CELERY_TIMEZONE": timezone,
-        "CELERY_TASK_TRACK_STARTED": True,
+        # Every task is fire-and-forget (callers only keep the task id), so skip the
+        # result/STARTED writes; a task that needs one opts in with ignore_result=False.
+        "CELERY_TASK_IGNORE_RESULT": True,
+        "CELERY_RESULT_EXPIRES": 3600,
+        "CELERY_BROKER_TRANSPORT_OPTIONS": {"visibility_timeout": 3600, "socket_keepalive": True},
         "CELERY_TASK_ALWAYS_EAGER": env.bool("CELERY_TASK_ALWAYS_EAGER", default=False),
-        "CELERY_ACCEPT_CONTENT": ["json"],
-        "CELERY_TASK_SERIALIZER": "json",
-        "CELERY_RESULT_SERIALIZER": "json",
+        # orjson (registered in app.celery_serializer) for task/result payloads; plain
+        # json stays accepted so messages queued before the switch still decode.
+        "CELERY_ACCEPT_CONTENT": ["orjson", "json"],
+        "CELERY_TASK_SERIALIZER": "orjson",
+        "CELERY_RESULT_SERIALIZER": "orjson",
         "CELERY_BEAT_SCHEDULE": {
             "monitors.schedule_endpoint_checks": {
                 "task": "monitors.tasks.schedule_endpoint_checks",
-                "schedule": timedelta(minutes=1),
+                "schedule": ENDPOINT_CHECK_SCHEDULE,
             }
         },
     }
 
 
+def build_cache_config(
+    env: environ.Env | None = None,
+    *,
+    redis_url: str | None = None,
+) -> dict[str, Any]:
+    """
+    Return CACHES with a Redis-backed default cache shared by all processes.
+
+    CACHE_URL accepts any django-environ cache URL (e.g. locmemcache:// for a
+    Redis-less local run); by default it reuses REDIS_URL's server on database 2,
+    next to the Celery broker (0) and result backend (1).
+    """
+
+    env = env or get_env()
+    redis_url = redis_url or env("REDIS_URL", default="redis://127.0.0.1:6379/0")
+    cache_default = urlsplit(redis_url)._replace(path="/2").geturl()
+    return {"default": env.cache_url("CACHE_URL", default=cache_default)}
+
+
+def build_jwt_signing_config(secret_key: str, env: environ.Env | None = None) -> Mapping[str, Any]:
+    """
+    Return the SIMPLE_JWT signing entries.
+
+    HS256 with SECRET_KEY by default. When JWT_SIGNING_KEY_FILE / JWT_VERIFYING_KEY_FILE
+    point at an Ed25519 PEM key pair, tokens are signed with EdDSA instead, so other
+    services can verify them with the public key alone.
+    """
+
+    env = env or get_env()
+    signing_key_file = env("JWT_SIGNING_KEY_FILE", default="")
+    verifying_key_file = env("JWT_VERIFYING_KEY_FILE", default="")
+    if not signing_key_file and not verifying_key_file:
+        return {"ALGORITHM": "HS256", "SIGNING_KEY": secret_key, "VERIFYING_KEY": None}
+    if not (signing_key_file and verifying_key_file):
+        raise ValueError("JWT_SIGNING_KEY_FILE and JWT_VERIFYING_KEY_FILE must be set together.")
+    return {
+        "ALGORITHM": "EdDSA",
+        "SIGNING_KEY": Path(signing_key_file).read_text(),
+        "VERIFYING_KEY": Path(verifying_key_file).read_text(),
+    }
+
+
 def build_stripe_config(env: environ.Env | None = None) -> Mapping[str, str]:
     env = env or get_env()
     return {
@@ -395,6 +582,12 @@ __all__ = [
     "BASE_DIR",
     "LOG_DIR",
     "get_env",
+    "STATIC_SERVING_APPS",
+    "STATIC_SERVING_MIDDLEWARE",
+    "get_env_snapshot",
+    "validate_production_secret_key",
+    "EnvSnapshot",
+    "load_env_file",
     "get_shared_apps",
     "get_tenant_apps",
     "get_middleware",
@@ -404,6 +597,8 @@ __all__ = [
     "TENANT_DOMAIN_MODEL",
     "PUBLIC_SCHEMA_NAME",
     "SHOW_PUBLIC_IF_NO_TENANT_FOUND",
+    "TENANT_LIMIT_SET_CALLS",
+    "TENANT_CACHE_TIMEOUT",
     "DATABASE_ROUTERS",
     "build_default_database_config",
     "build_rest_framework_config",
@@ -411,8 +606,11 @@ __all__ = [
     "build_logging_config",
     "build_email_defaults",
     "build_celery_config",
+    "build_cache_config",
+    "build_jwt_signing_config",
     "build_stripe_config",
     "get_dev_cors_settings",
+    "get_prod_allowed_hosts",
     "get_prod_cors_settings",
     "get_dev_csrf_trusted_origins",
     "get_prod_csrf_trusted_origins",
@@ -421,6 +619,7 @@ __all__ = [
     "get_dev_security_headers",
     "get_prod_security_headers",
     "get_permissions_policy",
+    "get_permissions_policy_header",
     "configure_sentry",
     "setup_settings_logging",
     "SettingsLoggingContext",
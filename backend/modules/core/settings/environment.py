@@ -0,0 +1,44 @@
+"""Typed, read-once snapshot of the environment flags settings branch on."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True, slots=True)
+class EnvSnapshot:
+    """Environment-derived flags, cast once so settings modules read plain attributes."""
+
+    debug: bool
+    enforce_https: bool
+    hsts_seconds: int
+    hsts_include_subdomains: bool
+    hsts_preload: bool
+    cors_allow_all_origins: bool
+    db_conn_max_age: int
+    db_conn_health_checks: bool
+    db_pool: bool
+    db_pool_min_size: int
+    db_pool_max_size: int
+    db_pool_timeout: int
+
+    @classmethod
+    def from_env(cls, env) -> EnvSnapshot:
+        enforce_https = env.bool("ENFORCE_HTTPS", default=True)
+        return cls(
+            debug=env.bool("DEBUG", default=False),
+            enforce_https=enforce_https,
+            # HSTS is only meaningful (and only read) when HTTPS is enforced
+            hsts_seconds=env.int("SECURE_HSTS_SECONDS", default=3600) if enforce_https else 0,
+            hsts_include_subdomains=(
+                env.bool("SECURE_HSTS_INCLUDE_SUBDOMAINS", default=True) if enforce_https else False
+            ),
+            hsts_preload=env.bool("SECURE_HSTS_PRELOAD", default=False) if enforce_https else False,
+            cors_allow_all_origins=env.bool("CORS_ALLOW_ALL_ORIGINS", default=False),
+            db_conn_max_age=env.int("DB_CONN_MAX_AGE", default=600),
+            db_conn_health_checks=env.bool("DB_CONN_HEALTH_CHECKS", default=True),
+            db_pool=env.bool("DB_POOL", default=False),
+            db_pool_min_size=env.int("DB_POOL_MIN_SIZE", default=2),
+            db_pool_max_size=env.int("DB_POOL_MAX_SIZE", default=10),
+            db_pool_timeout=env.int("DB_POOL_TIMEOUT", default=10),
+        )
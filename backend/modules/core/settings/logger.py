@@ -6,10 +6,53 @@ import logging
 import os
 from collections.abc import Mapping
 from dataclasses import dataclass
-from logging.handlers import RotatingFileHandler
+from logging.handlers import MemoryHandler, WatchedFileHandler
 from pathlib import Path
+from typing import Literal
+
+_ENV_TRUE_VALUES = frozenset({"1", "true", "yes", "on"})
+
+Environment = Literal["development", "production"]
+
+# backend/modules/core/settings/logger.py -> backend lives three levels up. resolve()
+# keeps BASE_DIR pointing at the real checkout when it is reached through a symlink;
+# it runs once per process, here, and modules.core.settings re-exports the result.
+BASE_DIR = Path(__file__).resolve().parents[3]
+LOG_DIR = BASE_DIR / "logs"
+
+_BANNER_RULE = "=" * 70
+_DEV_BANNER = "\n".join(
+    (
+        "✅ Development settings loaded successfully",
+        "   - DEBUG: True",
+        "   - ALLOWED_HOSTS: Permissive (localhost, *.local)",
+        "   - CORS: Permissive (localhost:5173)",
+        "   - HTTPS: Disabled",
+        "   - Email: Console backend",
+        "   - Stripe: Validation disabled",
+        "   - Sentry: Disabled",
+        _BANNER_RULE,
+    )
+)
+# Logged with the Sentry status and its detail as arguments.
+_PROD_BANNER = "\n".join(
+    (
+        "✅ Production settings loaded successfully",
+        "   - DEBUG: False",
+        "   - ALLOWED_HOSTS: From env (strict)",
+        "   - CORS: From env (strict)",
+        "   - HTTPS: Enforced",
+        "   - Email: SMTP backend",
+        "   - Stripe: Validation enabled",
+        "   - Sentry: %s (%s)",
+        _BANNER_RULE,
+    )
+)
 
-_ENV_TRUE_VALUES = {"1", "true", "yes", "on"}
+# Context resolved from os.environ by the first caller in this process. Entrypoints
+# (manage.py, wsgi, asgi, celery) and app.settings all call setup_settings_logging;
+# only the first one resolves the environment, attaches handlers and logs the banner.
+_process_context: SettingsLoggingContext | None = None
 
 
 @dataclass(frozen=True, slots=True)
@@ -19,9 +62,26 @@ class SettingsLoggingContext:
     logger: logging.Logger
     base_dir: Path
     log_dir: Path
-    environment: str
+    environment: Environment
     source: str
 
+    def log_loaded_banner(self, sentry_dsn: str, sentry_environment: str | None) -> None:
+        """Log the "settings loaded" summary for the selected environment."""
+
+        if self.environment == "development":
+            self.logger.info(_DEV_BANNER)
+        elif sentry_dsn:
+            # Values as resolved by configure_sentry
+            self.logger.info(_PROD_BANNER, "Enabled", sentry_environment)
+        else:
+            self.logger.info(_PROD_BANNER, "Disabled", "no DSN")
+
+    def flush(self) -> None:
+        """Write out the buffered settings.log records (call once settings are loaded)."""
+
+        for handler in self.logger.handlers:
+            handler.flush()
+
 
 def setup_settings_logging(
     *,
@@ -29,60 +89,74 @@ def setup_settings_logging(
     logger_name: str = "app.settings_loader",
     log_filename: str = "settings.log",
 ) -> SettingsLoggingContext:
-    """Configure the settings loader logger and resolve environment."""
+    """
+    Configure the settings loader logger and resolve environment.
+
+    Without an explicit ``env`` the result is computed once per process and reused
+    by later calls, whatever ``logger_name`` they pass.
+    """
+
+    global _process_context
+    if env is None and _process_context is not None:
+        return _process_context
 
     environ = env or os.environ
-    base_dir = Path(__file__).resolve().parents[3]
-    log_dir = base_dir / "logs"
-    log_dir.mkdir(exist_ok=True)
+    base_dir = BASE_DIR
+    log_dir = LOG_DIR
 
     logger = logging.getLogger(logger_name)
     logger.setLevel(logging.INFO)
+    # settings.log is this logger's only sink; once Django's LOGGING is applied the
+    # root handlers would otherwise repeat every record.
+    logger.propagate = False
     _ensure_handlers(logger, log_dir / log_filename)
 
     environment, source = _resolve_environment(environ)
     _log_routing_banner(logger, base_dir, log_dir, environment, source)
 
-    return SettingsLoggingContext(
+    context = SettingsLoggingContext(
         logger=logger,
         base_dir=base_dir,
         log_dir=log_dir,
         environment=environment,
         source=source,
     )
+    if env is None:
+        _process_context = context
+    return context
 
 
 def _ensure_handlers(logger: logging.Logger, log_path: Path) -> None:
     has_file_handler = any(
-        isinstance(handler, RotatingFileHandler)
-        and getattr(handler, "baseFilename", None) == str(log_path)
+        isinstance(handler, MemoryHandler)
+        and getattr(handler.target, "baseFilename", None) == str(log_path)
         for handler in logger.handlers
     )
     if not has_file_handler:
-        file_handler = RotatingFileHandler(log_path, maxBytes=10 * 1024 * 1024, backupCount=5)
+        log_path.parent.mkdir(exist_ok=True)
+        # The banners contain non-ASCII; delay opens the file on the first flush.
+        file_handler = WatchedFileHandler(log_path, encoding="utf-8", delay=True)
         file_handler.setFormatter(
             logging.Formatter("[%(levelname)s] %(asctime)s %(name)s - %(message)s")
         )
-        logger.addHandler(file_handler)
-
-    has_console_handler = any(
-        isinstance(handler, logging.StreamHandler) for handler in logger.handlers
-    )
-    if not has_console_handler:
-        console_handler = logging.StreamHandler()
-        console_handler.setFormatter(logging.Formatter("[%(levelname)s] %(name)s - %(message)s"))
-        logger.addHandler(console_handler)
+        # Settings load logs in a burst; buffer it into one write. Warnings flush at
+        # once, SettingsLoggingContext.flush() after loading, logging.shutdown at exit.
+        logger.addHandler(
+            MemoryHandler(
+                capacity=64, flushLevel=logging.WARNING, target=file_handler, flushOnClose=True
+            )
+        )
 
 
-def _resolve_environment(environ: Mapping[str, str]) -> tuple[str, str]:
+def _resolve_environment(environ: Mapping[str, str]) -> tuple[Environment, str]:
     django_env = environ.get("DJANGO_ENV", "").strip().lower()
-    debug_flag = environ.get("DEBUG", "false").strip().lower() in _ENV_TRUE_VALUES
-
     if django_env == "production":
         return "production", "DJANGO_ENV=production"
     if django_env == "development":
         return "development", "DJANGO_ENV=development"
-    if debug_flag:
+
+    # DEBUG only matters when DJANGO_ENV does not name an environment.
+    if environ.get("DEBUG", "false").strip().lower() in _ENV_TRUE_VALUES:
         return "development", "DEBUG override"
     return "production", "default fail-safe"
 
@@ -91,14 +165,14 @@ def _log_routing_banner(
     logger: logging.Logger,
     base_dir: Path,
     log_dir: Path,
-    environment: str,
+    environment: Environment,
     source: str,
 ) -> None:
-    if environment == "production":
-        logger.info("PROD mode selected via %s", source)
-    else:
-        logger.info("DEV mode selected via %s", source)
-
-    logger.info("Loading settings from: app.settings_%s", environment)
-    logger.info("BASE_DIR: %s", base_dir)
-    logger.info("LOG_DIR: %s", log_dir)
+    logger.info(
+        "%s mode selected via %s\nLoading settings from: app.settings_%s\nBASE_DIR: %s\nLOG_DIR: %s",
+        "PROD" if environment == "production" else "DEV",
+        source,
+        environment,
+        base_dir,
+        log_dir,
+    )
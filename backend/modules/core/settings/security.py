@@ -3,8 +3,11 @@
 from __future__ import annotations
 
 from collections.abc import Mapping
+from functools import cache
 from typing import Any
 
+from modules.core.settings.environment import EnvSnapshot
+
 _COMMON_CORS_ALLOW_HEADERS = [
     "accept",
     "accept-encoding",
@@ -48,6 +51,13 @@ _PROD_DEFAULT_ALLOWED_REGEXES = [
     r"^https://[a-z0-9-]+\.statuswatch\.local$",
 ]
 
+_PROD_DEFAULT_ALLOWED_HOSTS = [
+    "django-01.local",
+    ".django-01.local",
+    "statuswatch.local",
+    ".statuswatch.local",
+]
+
 _PROD_DEFAULT_CSRF = [
     "https://statuswatch.local",
     "https://*.statuswatch.local",
@@ -64,10 +74,29 @@ _PERMISSIONS_POLICY: Mapping[str, list[str]] = {
     "gyroscope": [],
 }
 
+# CSP source lists shared by the dev and prod header sets.
+_SELF = ("'self'",)
+_SELF_INLINE = ("'self'", "'unsafe-inline'")
+_SELF_INLINE_EVAL = ("'self'", "'unsafe-inline'", "'unsafe-eval'")
+_NONE = ("'none'",)
+
+# Headers identical in every environment; the getters only add what differs.
+_COMMON_SECURITY_HEADERS: Mapping[str, Any] = {
+    "SECURE_CROSS_ORIGIN_OPENER_POLICY": "same-origin",
+    "X_FRAME_OPTIONS": "DENY",
+    "SECURE_CONTENT_TYPE_NOSNIFF": True,
+    "SECURE_REFERRER_POLICY": "same-origin",
+    "CSP_FRAME_ANCESTORS": _NONE,
+    "CSP_BASE_URI": _SELF,
+    "CSP_FORM_ACTION": _SELF,
+}
+
+_PROXY_SSL_HEADER = ("HTTP_X_FORWARDED_PROTO", "https")
+
 
-def get_dev_cors_settings(env) -> Mapping[str, Any]:
+def get_dev_cors_settings(snapshot: EnvSnapshot) -> Mapping[str, Any]:
     return {
-        "CORS_ALLOW_ALL_ORIGINS": env.bool("CORS_ALLOW_ALL_ORIGINS", default=False),
+        "CORS_ALLOW_ALL_ORIGINS": snapshot.cors_allow_all_origins,
         "CORS_ALLOWED_ORIGINS": _DEV_ALLOWED_ORIGINS,
         "CORS_ALLOWED_ORIGIN_REGEXES": _DEV_ALLOWED_REGEXES,
         "CORS_ALLOW_CREDENTIALS": True,
@@ -75,16 +104,28 @@ def get_dev_cors_settings(env) -> Mapping[str, Any]:
     }
 
 
+def _env_unique_list(env, var: str, default: list[str]) -> list[str]:
+    """Read an env list, dropping blanks and repeats (order kept).
+
+    Django and django-cors-headers scan these lists linearly on every request, so
+    duplicated entries from hand-edited env files cost real per-request work.
+    """
+
+    return list(dict.fromkeys(item for item in env.list(var, default=default) if item))
+
+
+def get_prod_allowed_hosts(env) -> list[str]:
+    return _env_unique_list(env, "ALLOWED_HOSTS", _PROD_DEFAULT_ALLOWED_HOSTS)
+
+
 def get_prod_cors_settings(env) -> Mapping[str, Any]:
     return {
         "CORS_ALLOW_ALL_ORIGINS": False,
-        "CORS_ALLOWED_ORIGINS": env.list(
-            "CORS_ALLOWED_ORIGINS",
-            default=_PROD_DEFAULT_ALLOWED_ORIGINS,
+        "CORS_ALLOWED_ORIGINS": _env_unique_list(
+            env, "CORS_ALLOWED_ORIGINS", _PROD_DEFAULT_ALLOWED_ORIGINS
         ),
-        "CORS_ALLOWED_ORIGIN_REGEXES": env.list(
-            "CORS_ALLOWED_ORIGIN_REGEXES",
-            default=_PROD_DEFAULT_ALLOWED_REGEXES,
+        "CORS_ALLOWED_ORIGIN_REGEXES": _env_unique_list(
+            env, "CORS_ALLOWED_ORIGIN_REGEXES", _PROD_DEFAULT_ALLOWED_REGEXES
         ),
         "CORS_ALLOW_CREDENTIALS": True,
         "CORS_ALLOW_HEADERS": _COMMON_CORS_ALLOW_HEADERS,
@@ -96,7 +137,7 @@ def get_dev_csrf_trusted_origins() -> list[str]:
 
 
 def get_prod_csrf_trusted_origins(env) -> list[str]:
-    return env.list("CSRF_TRUSTED_ORIGINS", default=_PROD_DEFAULT_CSRF)
+    return _env_unique_list(env, "CSRF_TRUSTED_ORIGINS", _PROD_DEFAULT_CSRF)
 
 
 def get_dev_https_settings() -> Mapping[str, Any]:
@@ -107,7 +148,7 @@ def get_dev_https_settings() -> Mapping[str, Any]:
         "SECURE_HSTS_INCLUDE_SUBDOMAINS": False,
         "SECURE_HSTS_PRELOAD": False,
         "USE_X_FORWARDED_HOST": True,
-        "SECURE_PROXY_SSL_HEADER": ("HTTP_X_FORWARDED_PROTO", "https"),
+        "SECURE_PROXY_SSL_HEADER": _PROXY_SSL_HEADER,
         "SESSION_COOKIE_SECURE": False,
         "CSRF_COOKIE_SECURE": False,
         "SESSION_COOKIE_HTTPONLY": True,
@@ -117,22 +158,17 @@ def get_dev_https_settings() -> Mapping[str, Any]:
     }
 
 
-def get_prod_https_settings(env) -> Mapping[str, Any]:
-    enforce_https = env.bool("ENFORCE_HTTPS", default=True)
-    hsts_seconds = env.int("SECURE_HSTS_SECONDS", default=3600) if enforce_https else 0
-    hsts_include = (
-        env.bool("SECURE_HSTS_INCLUDE_SUBDOMAINS", default=True) if enforce_https else False
-    )
-    hsts_preload = env.bool("SECURE_HSTS_PRELOAD", default=False) if enforce_https else False
+def get_prod_https_settings(snapshot: EnvSnapshot) -> Mapping[str, Any]:
+    enforce_https = snapshot.enforce_https
 
     return {
         "ENFORCE_HTTPS": enforce_https,
         "SECURE_SSL_REDIRECT": enforce_https,
-        "SECURE_HSTS_SECONDS": hsts_seconds,
-        "SECURE_HSTS_INCLUDE_SUBDOMAINS": hsts_include,
-        "SECURE_HSTS_PRELOAD": hsts_preload,
+        "SECURE_HSTS_SECONDS": snapshot.hsts_seconds,
+        "SECURE_HSTS_INCLUDE_SUBDOMAINS": snapshot.hsts_include_subdomains,
+        "SECURE_HSTS_PRELOAD": snapshot.hsts_preload,
         "USE_X_FORWARDED_HOST": True,
-        "SECURE_PROXY_SSL_HEADER": ("HTTP_X_FORWARDED_PROTO", "https"),
+        "SECURE_PROXY_SSL_HEADER": _PROXY_SSL_HEADER,
         "SESSION_COOKIE_SECURE": enforce_https,
         "CSRF_COOKIE_SECURE": enforce_https,
         "SESSION_COOKIE_HTTPONLY": True,
@@ -142,41 +178,120 @@ def get_prod_https_settings(env) -> Mapping[str, Any]:
     }
 
 
-def get_dev_security_headers() -> Mapping[str, Any]:
-    return {
-        "SECURE_CROSS_ORIGIN_OPENER_POLICY": "same-origin",
-        "X_FRAME_OPTIONS": "DENY",
-        "SECURE_CONTENT_TYPE_NOSNIFF": True,
-        "SECURE_REFERRER_POLICY": "same-origin",
-        "CSP_DEFAULT_SRC": ("'self'", "'unsafe-inline'", "'unsafe-eval'"),
-        "CSP_SCRIPT_SRC": ("'self'", "'unsafe-inline'", "'unsafe-eval'"),
-        "CSP_STYLE_SRC": ("'self'", "'unsafe-inline'"),
+# Content-Security-Policy directive -> settings name holding its sources, in header order.
+CSP_DIRECTIVES = (
+    ("default-src", "CSP_DEFAULT_SRC"),
+    ("script-src", "CSP_SCRIPT_SRC"),
+    ("style-src", "CSP_STYLE_SRC"),
+    ("font-src", "CSP_FONT_SRC"),
+    ("img-src", "CSP_IMG_SRC"),
+    ("connect-src", "CSP_CONNECT_SRC"),
+    ("frame-ancestors", "CSP_FRAME_ANCESTORS"),
+    ("base-uri", "CSP_BASE_URI"),
+    ("form-action", "CSP_FORM_ACTION"),
+)
+
+
+def build_csp_header(headers: Mapping[str, Any]) -> str:
+    """Render the CSP_* source settings as one Content-Security-Policy header value."""
+
+    return "; ".join(
+        f"{directive} {' '.join(headers[setting_name])}"
+        for directive, setting_name in CSP_DIRECTIVES
+        if headers.get(setting_name)
+    )
+
+
+def _policy_origin(origin: str) -> str:
+    return origin if origin == "*" else f'"{origin}"'
+
+
+def build_permissions_policy_header(policy: Mapping[str, list[str]]) -> str:
+    """Render a feature -> allowed origins mapping as one Permissions-Policy header value."""
+
+    return ", ".join(
+        f"{feature}=({' '.join(_policy_origin(origin) for origin in origins)})"
+        for feature, origins in policy.items()
+    )
+
+
+def _with_csp_header(headers: Mapping[str, Any]) -> Mapping[str, Any]:
+    return {**headers, "CSP_HEADER": build_csp_header(headers)}
+
+
+# Final per-environment header settings, CSP header value included, built once at import.
+_DEV_SECURITY_HEADERS = _with_csp_header(
+    {
+        **_COMMON_SECURITY_HEADERS,
+        "CSP_DEFAULT_SRC": _SELF_INLINE_EVAL,
+        "CSP_SCRIPT_SRC": _SELF_INLINE_EVAL,
+        "CSP_STYLE_SRC": _SELF_INLINE,
         "CSP_CONNECT_SRC": ("'self'", "ws:", "wss:"),
-        "CSP_FONT_SRC": ("'self'",),
+        "CSP_FONT_SRC": _SELF,
         "CSP_IMG_SRC": ("'self'", "data:"),
-        "CSP_FRAME_ANCESTORS": ("'none'",),
-        "CSP_BASE_URI": ("'self'",),
-        "CSP_FORM_ACTION": ("'self'",),
     }
+)
 
-
-def get_prod_security_headers() -> Mapping[str, Any]:
-    return {
-        "SECURE_CROSS_ORIGIN_OPENER_POLICY": "same-origin",
-        "X_FRAME_OPTIONS": "DENY",
-        "SECURE_CONTENT_TYPE_NOSNIFF": True,
-        "SECURE_REFERRER_POLICY": "same-origin",
-        "CSP_DEFAULT_SRC": ("'self'",),
-        "CSP_SCRIPT_SRC": ("'self'", "'unsafe-inline'"),
+_PROD_SECURITY_HEADERS = _with_csp_header(
+    {
+        **_COMMON_SECURITY_HEADERS,
+        "CSP_DEFAULT_SRC": _SELF,
+        "CSP_SCRIPT_SRC": _SELF_INLINE,
         "CSP_STYLE_SRC": ("'self'", "'unsafe-inline'", "https://fonts.googleapis.com"),
         "CSP_FONT_SRC": ("'self'", "https://fonts.gstatic.com"),
         "CSP_IMG_SRC": ("'self'", "data:", "https:"),
         "CSP_CONNECT_SRC": ("'self'", "https://api.stripe.com"),
-        "CSP_FRAME_ANCESTORS": ("'none'",),
-        "CSP_BASE_URI": ("'self'",),
-        "CSP_FORM_ACTION": ("'self'",),
     }
+)
+
+
+def get_dev_security_headers() -> Mapping[str, Any]:
+    return _DEV_SECURITY_HEADERS
+
+
+def get_prod_security_headers() -> Mapping[str, Any]:
+    return _PROD_SECURITY_HEADERS
+
+
+MIN_SECRET_KEY_LENGTH = 50
+
+_SECRET_KEY_HINT = (
+    "Generate a secure key with: python -c 'from django.core.management.utils import "
+    "get_random_secret_key; print(get_random_secret_key())'"
+)
+
+
+@cache
+def validate_production_secret_key(secret_key: str | None) -> str:
+    """Return secret_key if it is fit for production, else raise ValueError.
+
+    Cached per key, so re-imports of the settings in one process skip the checks.
+    """
+
+    if not secret_key:
+        raise ValueError(
+            "SECRET_KEY is not set. Please set it in your .env file or environment variables.\n"
+            + _SECRET_KEY_HINT
+        )
+    if secret_key.startswith("django-insecure"):
+        raise ValueError(
+            "Cannot use 'django-insecure' SECRET_KEY in production (DEBUG=False).\n"
+            + _SECRET_KEY_HINT
+        )
+    if len(secret_key) < MIN_SECRET_KEY_LENGTH:
+        raise ValueError(
+            f"SECRET_KEY must be at least {MIN_SECRET_KEY_LENGTH} characters long in production.\n"
+            + _SECRET_KEY_HINT
+        )
+    return secret_key
 
 
 def get_permissions_policy() -> Mapping[str, list[str]]:
     return _PERMISSIONS_POLICY
+
+
+def get_permissions_policy_header() -> str:
+    return _PERMISSIONS_POLICY_HEADER
+
+
+_PERMISSIONS_POLICY_HEADER = build_permissions_policy_header(_PERMISSIONS_POLICY)
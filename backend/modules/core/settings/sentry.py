@@ -3,16 +3,55 @@
 from __future__ import annotations
 
 from collections.abc import Mapping
+from functools import partial
+from types import MappingProxyType
 from typing import Any
 
+_EMPTY: Mapping[str, Any] = MappingProxyType({})
 
-def configure_sentry(env, *, default_environment: str = "production") -> Mapping[str, Any]:
-    """Initialize Sentry based on environment variables and return config data."""
+_SENTRY_SENSITIVE_HEADERS = frozenset({"Authorization", "Cookie", "X-CSRF-Token"})
+_SENTRY_SENSITIVE_ENV_KEYS = frozenset(
+    {"SECRET_KEY", "DATABASE_URL", "REDIS_URL", "STRIPE_SECRET_KEY", "EMAIL_HOST_PASSWORD"}
+)
+
+
+def _scrub_sentry_event(event, hint):
+    if "request" in event:
+        headers = event["request"].get("headers", {})
+        for header in _SENTRY_SENSITIVE_HEADERS & headers.keys():
+            headers[header] = "[Filtered]"
+
+    if "contexts" in event and "runtime" in event["contexts"]:
+        env_vars = event["contexts"]["runtime"].get("env", {})
+        for key in _SENTRY_SENSITIVE_ENV_KEYS & env_vars.keys():
+            env_vars[key] = "[Filtered]"
+
+    return event
+
+
+def _traces_sampler(sampling_context, *, rate: float) -> float:
+    # Called for every transaction; health probes are never traced.
+    path = sampling_context.get("wsgi_environ", _EMPTY).get("PATH_INFO", "")
+    return 0.0 if path.startswith("/health") else rate
+
+
+def configure_sentry(
+    env,
+    *,
+    default_environment: str = "production",
+    debug: bool = False,
+) -> Mapping[str, Any]:
+    """
+    Initialize Sentry based on environment variables and return config data.
+
+    ``debug`` keeps INFO log records as breadcrumbs and traces Django signals;
+    otherwise only WARNING+ breadcrumbs are recorded, signal spans are skipped
+    and Celery beat tasks are reported as cron monitors.
+    """
 
     dsn = env("SENTRY_DSN", default="")
     environment_override = env("SENTRY_ENVIRONMENT", default="")
     traces_sample_rate = env.float("SENTRY_TRACES_SAMPLE_RATE", default=0.1)
-    release = env("SENTRY_RELEASE", default=None)
 
     if not dsn:
         result = {
@@ -31,34 +70,8 @@ def configure_sentry(env, *, default_environment: str = "production") -> Mapping
     from sentry_sdk.integrations.logging import LoggingIntegration
     from sentry_sdk.integrations.redis import RedisIntegration
 
-    def _scrub_sentry_event(event, hint):
-        if "request" in event:
-            headers = event["request"].get("headers", {})
-            for header in ["Authorization", "Cookie", "X-CSRF-Token"]:
-                if header in headers:
-                    headers[header] = "[Filtered]"
-
-        if "contexts" in event and "runtime" in event["contexts"]:
-            env_vars = event["contexts"]["runtime"].get("env", {})
-            for key in [
-                "SECRET_KEY",
-                "DATABASE_URL",
-                "REDIS_URL",
-                "STRIPE_SECRET_KEY",
-                "EMAIL_HOST_PASSWORD",
-            ]:
-                if key in env_vars:
-                    env_vars[key] = "[Filtered]"
-
-        return event
-
-    def _traces_sampler(sampling_context):
-        path = sampling_context.get("wsgi_environ", {}).get("PATH_INFO", "")
-        if path.startswith("/health"):
-            return 0.0
-        return traces_sample_rate
-
     environment = environment_override or default_environment
+    release = env("SENTRY_RELEASE", default=None)
 
     sentry_sdk.init(
         dsn=dsn,
@@ -66,15 +79,19 @@ def configure_sentry(env, *, default_environment: str = "production") -> Mapping
         traces_sample_rate=traces_sample_rate,
         profiles_sample_rate=0.1,
         integrations=[
-            DjangoIntegration(transaction_style="url", middleware_spans=True, signals_spans=True),
-            CeleryIntegration(monitor_beat_tasks=True, exclude_beat_tasks=[]),
+            # Signal spans (one per ORM save/delete/request signal) and beat cron monitors
+            # are only worth their cost in debugging and in production respectively.
+            DjangoIntegration(transaction_style="url", middleware_spans=True, signals_spans=debug),
+            CeleryIntegration(monitor_beat_tasks=not debug, exclude_beat_tasks=[]),
             RedisIntegration(),
-            LoggingIntegration(level=logging.INFO, event_level=logging.ERROR),
+            LoggingIntegration(
+                level=logging.INFO if debug else logging.WARNING, event_level=logging.ERROR
+            ),
         ],
         send_default_pii=False,
         attach_stacktrace=True,
         enable_tracing=True,
-        traces_sampler=_traces_sampler,
+        traces_sampler=partial(_traces_sampler, rate=traces_sample_rate),
         release=release,
         before_send=_scrub_sentry_event,
     )
@@ -8,37 +8,45 @@ from __future__ import annotations
 
 from collections.abc import Iterable
 
+# Canonical default app lists; INSTALLED_APPS is derived from them once at import
+# so the common (nothing registered) path does no list building per lookup.
+_DEFAULT_SHARED_APPS: tuple[str, ...] = (
+    "django_tenants",
+    "django.contrib.contenttypes",
+    "django.contrib.staticfiles",
+    "rest_framework",
+    "corsheaders",
+    "tenants",
+    "django_celery_beat",
+)
+_DEFAULT_TENANT_APPS: tuple[str, ...] = (
+    "django.contrib.admin",
+    "django.contrib.auth",
+    "django.contrib.sessions",
+    "django.contrib.messages",
+    "rest_framework_simplejwt.token_blacklist",
+    "api",
+    "monitors",
+)
+_DEFAULT_INSTALLED_APPS: tuple[str, ...] = tuple(
+    dict.fromkeys((*_DEFAULT_SHARED_APPS, *_DEFAULT_TENANT_APPS))
+)
+
 
 class SettingsRegistry:
     """Keeps track of shared vs tenant apps and middleware chains."""
 
     def __init__(self) -> None:
-        self._shared_apps: list[str] = [
-            "django_tenants",
-            "django.contrib.contenttypes",
-            "django.contrib.staticfiles",
-            "rest_framework",
-            "corsheaders",
-            "tenants",
-            "django_celery_beat",
-        ]
-        self._tenant_apps: list[str] = [
-            "django.contrib.admin",
-            "django.contrib.auth",
-            "django.contrib.sessions",
-            "django.contrib.messages",
-            "rest_framework_simplejwt.token_blacklist",
-            "api",
-            "monitors",
-        ]
+        self._shared_apps: list[str] = list(_DEFAULT_SHARED_APPS)
+        self._tenant_apps: list[str] = list(_DEFAULT_TENANT_APPS)
+        self._installed_apps: tuple[str, ...] | None = _DEFAULT_INSTALLED_APPS
         self._middleware: list[str] = [
             "app.middleware_internal.InternalEndpointMiddleware",
             "app.middleware_security_custom.CustomSecurityMiddleware",
             "app.middleware.SecurityHeadersMiddleware",
             "whitenoise.middleware.WhiteNoiseMiddleware",
-            "django_tenants.middleware.main.TenantMainMiddleware",
+            "app.middleware_tenant_cache.CachedTenantMainMiddleware",
             "app.middleware_tenant_logging.TenantRoutingLoggingMiddleware",
-            "app.middleware_logging.RequestIDMiddleware",
             "app.middleware_logging.RequestLoggingMiddleware",
             "corsheaders.middleware.CorsMiddleware",
             "app.middleware_cors_logging.CorsLoggingMiddleware",
@@ -55,9 +63,11 @@ class SettingsRegistry:
     # ------------------------------------------------------------------
     def register_shared_apps(self, *apps: str) -> None:
         self._shared_apps = _append_unique(self._shared_apps, apps)
+        self._installed_apps = None
 
     def register_tenant_apps(self, *apps: str) -> None:
         self._tenant_apps = _append_unique(self._tenant_apps, apps)
+        self._installed_apps = None
 
     def register_middleware(self, *middleware_classes: str) -> None:
         self._middleware = _append_unique(self._middleware, middleware_classes)
@@ -77,12 +87,12 @@ class SettingsRegistry:
     def middleware(self) -> list[str]:
         return self._middleware
 
-    def build_installed_apps(self) -> list[str]:
+    def build_installed_apps(self) -> tuple[str, ...]:
         """Return final INSTALLED_APPS preserving the shared->tenant order."""
 
-        return list(self._shared_apps) + [
-            app for app in self._tenant_apps if app not in self._shared_apps
-        ]
+        if self._installed_apps is None:
+            self._installed_apps = tuple(dict.fromkeys((*self._shared_apps, *self._tenant_apps)))
+        return self._installed_apps
 
 
 def _append_unique(target: list[str], new_items: Iterable[str]) -> list[str]:
@@ -119,7 +129,7 @@ def get_middleware() -> list[str]:
     return core_settings_registry.middleware
 
 
-def get_installed_apps() -> list[str]:
+def get_installed_apps() -> tuple[str, ...]:
     return core_settings_registry.build_installed_apps()
 
 
@@ -0,0 +1,77 @@
+"""Hostname -> tenant resolution cache shared by the tenant middleware."""
+
+from __future__ import annotations
+
+import logging
+from collections.abc import Iterable
+
+from django.conf import settings
+from django.core.cache import cache
+
+logger = logging.getLogger("modules.tenancy.cache")
+
+TENANT_CACHE_KEY = "tenant:host:{hostname}"
+
+
+def get_cached_tenant(domain_model, hostname: str):
+    """
+    Return the tenant serving ``hostname``, from the cache when possible.
+
+    Misses fall through to the usual Domain lookup; unknown hostnames raise
+    ``domain_model.DoesNotExist`` and are not cached. If the cache backend is
+    unreachable the lookup goes to the database, so a Redis outage does not take
+    tenant requests down with it.
+    """
+
+    timeout = settings.TENANT_CACHE_TIMEOUT
+    if not timeout:
+        return _lookup_tenant(domain_model, hostname)
+
+    key = TENANT_CACHE_KEY.format(hostname=hostname)
+    try:
+        tenant = cache.get(key)
+    except Exception:
+        logger.warning("Tenant cache unavailable, resolving %s from the database", hostname)
+        return _lookup_tenant(domain_model, hostname)
+
+    if tenant is None:
+        tenant = _lookup_tenant(domain_model, hostname)
+        try:
+            cache.set(key, tenant, timeout)
+        except Exception:
+            logger.warning("Tenant cache unavailable, %s not cached", hostname)
+    return tenant
+
+
+def _lookup_tenant(domain_model, hostname: str):
+    return domain_model.objects.select_related("tenant").get(domain=hostname).tenant
+
+
+def invalidate_tenant_hosts(hostnames: Iterable[str]) -> None:
+    """Drop cached resolutions for the given hostnames."""
+
+    keys = [TENANT_CACHE_KEY.format(hostname=hostname) for hostname in hostnames]
+    if keys:
+        cache.delete_many(keys)
+
+
+def remember_domain_hostname(sender, instance, **kwargs) -> None:
+    """pre_save receiver for Domain rows; keeps the hostname a rename replaces."""
+
+    if instance.pk is not None:
+        instance._previous_hostname = (
+            sender.objects.filter(pk=instance.pk).values_list("domain", flat=True).first()
+        )
+
+
+def invalidate_domain(sender, instance, **kwargs) -> None:
+    """post_save/post_delete receiver for Domain rows; clears old and new hostname."""
+
+    previous = getattr(instance, "_previous_hostname", None)
+    invalidate_tenant_hosts({instance.domain, previous} - {None})
+
+
+def invalidate_tenant(sender, instance, **kwargs) -> None:
+    """post_save receiver for tenants; clears every hostname they serve."""
+
+    invalidate_tenant_hosts(instance.domains.values_list("domain", flat=True))
@@ -1,6 +1,26 @@
 from django.apps import AppConfig
+from django.db.models.signals import post_delete, post_save, pre_save
 
 
 class TenantsConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "tenants"
+
+    def ready(self):
+        from modules.tenancy.cache import (
+            invalidate_domain,
+            invalidate_tenant,
+            remember_domain_hostname,
+        )
+
+        from tenants.models import Client, Domain
+
+        # Deleting a tenant cascades to its Domain rows, whose post_delete clears them.
+        post_save.connect(invalidate_tenant, sender=Client, dispatch_uid="tenant_cache_client")
+        pre_save.connect(
+            remember_domain_hostname, sender=Domain, dispatch_uid="tenant_cache_domain_rename"
+        )
+        post_save.connect(invalidate_domain, sender=Domain, dispatch_uid="tenant_cache_domain")
+        post_delete.connect(
+            invalidate_domain, sender=Domain, dispatch_uid="tenant_cache_domain_delete"
+        )
@@ -8,7 +8,9 @@ pytestmark = pytest.mark.django_db  # allow DB if anything touches it
 def test_admin_index_route_smoke(client, settings):
     # Skip tenant resolution for this simple smoke test
     settings.MIDDLEWARE = [
-        m for m in settings.MIDDLEWARE if m != "django_tenants.middleware.main.TenantMainMiddleware"
+        m
+        for m in settings.MIDDLEWARE
+        if m != "app.middleware_tenant_cache.CachedTenantMainMiddleware"
     ]
 
     resp = client.get(reverse("admin:index"))
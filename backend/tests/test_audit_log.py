@@ -0,0 +1,82 @@
+import logging
+from logging.handlers import WatchedFileHandler
+
+from api import audit_log
+from api.audit_log import AuditBatcher, AuditEvent, log_audit_event
+
+
+class _ListHandler(logging.Handler):
+    def __init__(self):
+        super().__init__()
+        self.records: list[logging.LogRecord] = []
+
+    def emit(self, record):
+        self.records.append(record)
+
+
+def _make_logger(name: str) -> tuple[logging.Logger, _ListHandler]:
+    logger = logging.getLogger(name)
+    logger.propagate = False
+    logger.setLevel(logging.INFO)
+    handler = _ListHandler()
+    logger.addHandler(handler)
+    return logger, handler
+
+
+def _make_unstarted_batcher(logger: logging.Logger, **kwargs) -> AuditBatcher:
+    batcher = AuditBatcher(logger, **kwargs)
+    batcher._ensure_started = lambda: None  # keep the flusher thread from draining the queue
+    return batcher
+
+
+def test_flush_sync_emits_queued_records():
+    logger, handler = _make_logger("tests.audit.flush")
+    batcher = _make_unstarted_batcher(logger)
+
+    for index in range(3):
+        batcher.enqueue(logger.makeRecord(logger.name, logging.INFO, "", 0, str(index), (), None))
+    batcher.flush_sync()
+
+    assert [record.getMessage() for record in handler.records] == ["0", "1", "2"]
+
+
+def test_enqueue_drops_records_when_queue_is_full():
+    logger, _ = _make_logger("tests.audit.overflow")
+    batcher = _make_unstarted_batcher(logger, max_queue_size=1)
+
+    record = logger.makeRecord(logger.name, logging.INFO, "", 0, "event", (), None)
+    batcher.enqueue(record)
+    batcher.enqueue(record)
+
+    assert batcher.dropped == 1
+
+
+def test_log_audit_event_preserves_structured_fields(monkeypatch):
+    logger, handler = _make_logger("tests.audit.fields")
+    batcher = _make_unstarted_batcher(logger)
+    monkeypatch.setattr(audit_log, "audit_batcher", batcher)
+
+    log_audit_event(AuditEvent.USER_LOGIN, user_id=7, details={"host": "acme.localhost"})
+    batcher.flush_sync()
+
+    record = handler.records[0]
+    assert record.getMessage() == "Audit: user_login"
+    assert record.audit_category == "authentication"
+    assert record.audit_details == {"host": "acme.localhost"}
+
+
+def test_watched_file_handler_reopens_after_logrotate_rename(tmp_path):
+    logger = logging.getLogger("tests.audit.rotate")
+    logger.propagate = False
+    log_path = tmp_path / "audit.log"
+    logger.addHandler(WatchedFileHandler(log_path, delay=True, encoding="utf-8"))
+    batcher = _make_unstarted_batcher(logger)
+
+    batcher.enqueue(logger.makeRecord(logger.name, logging.INFO, "", 0, "before", (), None))
+    batcher.flush_sync()
+    log_path.rename(tmp_path / "audit.log.1")
+    batcher.enqueue(logger.makeRecord(logger.name, logging.INFO, "", 0, "after", (), None))
+    batcher.flush_sync()
+
+    assert log_path.read_text() == "after\n"
+    assert (tmp_path / "audit.log.1").read_text() == "before\n"
@@ -0,0 +1,54 @@
+from unittest.mock import patch
+
+from django.core.cache.backends.base import DEFAULT_TIMEOUT, BaseCache
+from django.test import override_settings
+from modules.accounts import authentication
+from modules.accounts.authentication import (
+    acquire_refresh_lock,
+    is_jti_blacklisted_in_cache,
+    release_refresh_lock,
+)
+
+LOCMEM_CACHES = {"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
+UNREACHABLE_CACHES = {"default": {"BACKEND": f"{__name__}._UnreachableCache"}}
+
+
+class _UnreachableCache(BaseCache):
+    """Cache backend that fails like RedisCache does when Redis is down."""
+
+    def add(self, key, value, timeout=DEFAULT_TIMEOUT, version=None):
+        raise ConnectionError("cache unreachable")
+
+    def get(self, key, default=None, version=None):
+        raise ConnectionError("cache unreachable")
+
+    def delete(self, key, version=None):
+        raise ConnectionError("cache unreachable")
+
+
+@override_settings(CACHES=LOCMEM_CACHES)
+def test_refresh_lock_is_exclusive_until_released():
+    assert acquire_refresh_lock("jti-1")
+    assert not acquire_refresh_lock("jti-1")
+
+    release_refresh_lock("jti-1")
+
+    assert acquire_refresh_lock("jti-1")
+    release_refresh_lock("jti-1")
+
+
+@override_settings(CACHES=UNREACHABLE_CACHES)
+def test_refresh_lock_fails_open_when_cache_is_down():
+    with patch.object(authentication.logger, "warning") as warning:
+        assert acquire_refresh_lock("jti-1")
+        release_refresh_lock("jti-1")
+
+    assert warning.call_count == 2
+
+
+@override_settings(CACHES=UNREACHABLE_CACHES)
+def test_cached_blacklist_check_fails_open_when_cache_is_down():
+    with patch.object(authentication.logger, "warning") as warning:
+        assert is_jti_blacklisted_in_cache("jti-1") is False
+
+    warning.assert_called_once()
@@ -2,7 +2,11 @@
 
 from __future__ import annotations
 
+from decimal import Decimal
+
 from app.celery import celery_app
+from app.celery_serializer import ORJSON_CONTENT_TYPE
+from kombu.serialization import dumps, loads
 
 
 def test_schedule_endpoint_checks_task_registered():
@@ -12,3 +16,17 @@ def test_schedule_endpoint_checks_task_registered():
     assert task_name in celery_app.tasks
     task = celery_app.tasks[task_name]
     assert task.name == task_name
+
+
+def test_orjson_serializer_round_trips_task_payloads():
+    """Task bodies encoded with the orjson serializer decode to the same values."""
+
+    body = (["endpoint-id", "acme"], {"retries": 3, "amount": Decimal("9.99")}, {"chord": None})
+    content_type, content_encoding, payload = dumps(body, serializer="orjson")
+
+    assert content_type == ORJSON_CONTENT_TYPE
+    assert loads(payload, content_type, content_encoding) == [
+        ["endpoint-id", "acme"],
+        {"retries": 3, "amount": "9.99"},
+        {"chord": None},
+    ]
@@ -0,0 +1,35 @@
+import logging
+
+from app.middleware_cors_logging import CorsLoggingMiddleware, cors_logger
+from django.http import HttpResponse
+from modules.core.settings import build_logging_config
+
+
+class _UntouchedRequest:
+    """Request stand-in that fails the test if the middleware reads any header."""
+
+    method = "GET"
+    path = "/api/health/"
+
+    @property
+    def headers(self):
+        raise AssertionError("headers read while cors_debug logging is off")
+
+
+def test_cors_logging_skips_header_extraction_above_warning():
+    response = HttpResponse()
+    middleware = CorsLoggingMiddleware(lambda request: response)
+    previous_level = cors_logger.level
+    # setLevel, not attribute assignment, so isEnabledFor's cache is cleared.
+    cors_logger.setLevel(logging.ERROR)
+    try:
+        assert middleware(_UntouchedRequest()) is response
+    finally:
+        cors_logger.setLevel(previous_level)
+
+
+def test_cors_debug_level_comes_from_the_caller(tmp_path):
+    config = build_logging_config(tmp_path, cors_debug_level="ERROR")
+
+    assert config["loggers"]["cors_debug"]["level"] == "ERROR"
+    assert build_logging_config(tmp_path)["loggers"]["cors_debug"]["level"] == "WARNING"
@@ -82,6 +82,25 @@ class UserProfileModelTests(TestCase):
             self.assertNotEqual(profile.email_verification_token, old_token)
             self.assertIsNotNone(profile.email_verification_sent_at)
 
+    def test_token_hash_follows_regenerated_token(self):
+        """Lookup hash is stored on create and refreshed with the token."""
+        from api.models import hash_verification_token
+
+        with schema_context("test_tenant"):
+            profile = UserProfile.objects.create(user=self.user)
+            self.assertEqual(
+                profile.email_verification_token_hash,
+                hash_verification_token(profile.email_verification_token),
+            )
+
+            profile.regenerate_verification_token()
+            profile.refresh_from_db()
+
+            self.assertEqual(
+                profile.email_verification_token_hash,
+                hash_verification_token(profile.email_verification_token),
+            )
+
 
 class RegistrationWithEmailVerificationTests(APITestCase):
     """Test registration flow with email verification."""
@@ -232,7 +251,7 @@ class ResendVerificationEmailTests(APITestCase):
 
         response = self.client.post("/api/auth/resend-verification/")
 
-        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.status_code, status.HTTP_202_ACCEPTED)
         self.assertIn("resent", response.data["detail"].lower())
 
         # Verify new token was generated
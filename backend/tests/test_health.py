@@ -592,3 +592,25 @@ class TestMetrics:
 
                 assert response.status_code == status.HTTP_200_OK
                 assert response.data["environment"] == "unknown"
+
+
+class TestPing:
+    """Test suite for the ping liveness endpoint."""
+
+    @pytest.mark.parametrize("method", ["get", "head"])
+    def test_ping_answers_get_and_head_probes(self, request_factory, method):
+        """Load balancers probe with GET or HEAD; both must return 200."""
+        from api.views import PING_RESPONSE_BODY, ping
+
+        response = ping(getattr(request_factory, method)("/api/ping/"))
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.content == PING_RESPONSE_BODY
+
+    def test_ping_rejects_unsafe_methods(self, request_factory):
+        """POST is not a probe."""
+        from api.views import ping
+
+        response = ping(request_factory.post("/api/ping/"))
+
+        assert response.status_code == status.HTTP_405_METHOD_NOT_ALLOWED
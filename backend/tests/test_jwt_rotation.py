@@ -10,6 +10,7 @@ Tests cover:
 """
 
 from datetime import timedelta
+from unittest.mock import patch
 
 import pytest
 from django.conf import settings
@@ -19,6 +20,7 @@ from django_tenants.utils import schema_context
 from rest_framework import status
 from rest_framework.test import APIClient
 from rest_framework_simplejwt.token_blacklist.models import BlacklistedToken, OutstandingToken
+from rest_framework_simplejwt.tokens import RefreshToken
 
 User = get_user_model()
 
@@ -273,6 +275,55 @@ class TestTokenBlacklist:
         assert response.status_code == status.HTTP_400_BAD_REQUEST
         assert "invalid" in str(response.data).lower()
 
+    def test_logout_blacklists_synchronously_when_cache_unreachable(self, api_client, test_user):
+        """A cache outage must not fail logout; the blacklist row is written inline."""
+        url_obtain = reverse("token_obtain_pair")
+        response = api_client.post(
+            url_obtain,
+            {"username": "tokentest", "password": "TokenTest@123456"},
+            format="json",
+        )
+        access_token = response.data["access"]
+        refresh_token = response.data["refresh"]
+        jti = RefreshToken(refresh_token)["jti"]
+
+        url_logout = reverse("api-logout")
+        api_client.credentials(HTTP_AUTHORIZATION=f"Bearer {access_token}")
+        with (
+            patch(
+                "modules.accounts.authentication.cache.set",
+                side_effect=ConnectionError("cache unreachable"),
+            ),
+            patch("api.views.blacklist_refresh_token_task.delay") as delay,
+        ):
+            response = api_client.post(url_logout, {"refresh": refresh_token}, format="json")
+
+        assert response.status_code == status.HTTP_205_RESET_CONTENT
+        delay.assert_not_called()
+        with schema_context("test_tenant"):
+            assert BlacklistedToken.objects.filter(token__jti=jti).exists()
+
+    def test_logout_queues_jti_not_refresh_token(self, api_client, test_user):
+        """The Celery task receives the token's jti/user/exp, never the raw token."""
+        url_obtain = reverse("token_obtain_pair")
+        response = api_client.post(
+            url_obtain,
+            {"username": "tokentest", "password": "TokenTest@123456"},
+            format="json",
+        )
+        access_token = response.data["access"]
+        refresh_token = response.data["refresh"]
+        token = RefreshToken(refresh_token)
+
+        url_logout = reverse("api-logout")
+        api_client.credentials(HTTP_AUTHORIZATION=f"Bearer {access_token}")
+        with patch("api.views.blacklist_refresh_token_task.delay") as delay:
+            response = api_client.post(url_logout, {"refresh": refresh_token}, format="json")
+
+        assert response.status_code == status.HTTP_205_RESET_CONTENT
+        delay.assert_called_once_with(token["jti"], token["user_id"], token["exp"], "test_tenant")
+        assert refresh_token not in delay.call_args.args
+
 
 @pytest.mark.django_db
 class TestTokenBlacklistModels:
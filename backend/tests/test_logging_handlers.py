@@ -0,0 +1,55 @@
+import gc
+import logging
+import queue
+import weakref
+from logging.handlers import QueueListener
+
+from app.logging_handlers import BackgroundQueueHandler
+
+
+class _ListHandler(logging.Handler):
+    def __init__(self):
+        super().__init__()
+        self.records: list[logging.LogRecord] = []
+
+    def emit(self, record):
+        self.records.append(record)
+
+
+def test_background_queue_handler_starts_listener_on_first_record():
+    target = _ListHandler()
+    handler = BackgroundQueueHandler(queue.SimpleQueue())
+    handler.listener = QueueListener(handler.queue, target)
+    logger = logging.getLogger("tests.logging.background_queue")
+    logger.propagate = False
+    logger.addHandler(handler)
+
+    assert handler.listener._thread is None
+    logger.warning("queued %s", "record")
+    handler._stop_listener()
+
+    assert [record.getMessage() for record in target.records] == ["queued record"]
+
+
+def test_background_queue_handler_close_stops_listener_and_releases_handler():
+    target = _ListHandler()
+    handler = BackgroundQueueHandler(queue.SimpleQueue())
+    handler.listener = QueueListener(handler.queue, target)
+    handler.handle(logging.makeLogRecord({"msg": "before close"}))
+    listener = handler.listener
+
+    handler.close()
+
+    assert listener._thread is None
+    assert [record.getMessage() for record in target.records] == ["before close"]
+    assert handler not in BackgroundQueueHandler._instances
+
+
+def test_background_queue_handler_is_not_kept_alive_by_exit_hooks():
+    handler = BackgroundQueueHandler(queue.SimpleQueue())
+    handler_ref = weakref.ref(handler)
+
+    del handler
+    gc.collect()
+
+    assert handler_ref() is None
@@ -0,0 +1,32 @@
+import datetime
+
+import pytest
+from api.renderers import StatusWatchJSONRenderer
+from rest_framework import serializers
+from rest_framework.renderers import JSONRenderer
+
+
+class _CheckSerializer(serializers.Serializer):
+    name = serializers.CharField()
+    interval = serializers.DurationField()
+
+
+def test_duration_field_renders_like_drf():
+    data = _CheckSerializer({"name": "ping", "interval": datetime.timedelta(minutes=5)}).data
+
+    rendered = StatusWatchJSONRenderer().render(data)
+
+    assert rendered == b'{"name":"ping","interval":"00:05:00"}'
+    assert rendered == JSONRenderer().render(data)
+
+
+def test_raw_timedelta_renders_as_seconds_like_drf():
+    data = {"elapsed": datetime.timedelta(minutes=1, seconds=30)}
+
+    assert StatusWatchJSONRenderer().render(data) == JSONRenderer().render(data)
+    assert StatusWatchJSONRenderer().render(data) == b'{"elapsed":"90.0"}'
+
+
+def test_unknown_type_raises_instead_of_rendering_null():
+    with pytest.raises(TypeError):
+        StatusWatchJSONRenderer().render({"value": object()})
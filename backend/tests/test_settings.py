@@ -23,6 +23,15 @@ class SettingsArchitectureTest(TestCase):
         self.assertIsNotNone(settings.TEMPLATES)
         self.assertIsNotNone(settings.DATABASES)
 
+    def test_installed_apps_matches_registry_dedup(self):
+        """The precomputed INSTALLED_APPS tuple must not drift from SHARED_APPS + TENANT_APPS."""
+        from django.conf import settings
+
+        self.assertEqual(
+            tuple(settings.INSTALLED_APPS),
+            tuple(dict.fromkeys(settings.SHARED_APPS + settings.TENANT_APPS)),
+        )
+
     def test_django_tenants_configuration(self):
         """Verify django-tenants is configured correctly."""
         from django.conf import settings
@@ -30,9 +39,39 @@ class SettingsArchitectureTest(TestCase):
         self.assertEqual(settings.TENANT_MODEL, "tenants.Client")
         self.assertEqual(settings.DOMAIN_MODEL, "tenants.Domain")
         self.assertEqual(settings.PUBLIC_SCHEMA_NAME, "public")
+        self.assertTrue(settings.TENANT_LIMIT_SET_CALLS)
         self.assertIn("django_tenants", settings.SHARED_APPS)
         self.assertIn("api", settings.TENANT_APPS)
 
+    def test_file_log_handlers_open_lazily(self):
+        """File handlers defer opening their file until the first record."""
+        from django.conf import settings
+
+        file_handlers = [
+            handler
+            for handler in settings.LOGGING["handlers"].values()
+            if handler["class"] == "logging.handlers.WatchedFileHandler"
+        ]
+        self.assertTrue(file_handlers)
+        self.assertTrue(all(handler["delay"] for handler in file_handlers))
+
+    def test_hot_loggers_write_files_through_queue(self):
+        """Per-request and per-check loggers never write log files on the caller's thread."""
+        from django.conf import settings
+
+        handlers = settings.LOGGING["handlers"]
+        for name in (
+            "api.requests",
+            "api.performance",
+            "monitors.audit",
+            "monitors.performance",
+            "cors_debug",
+        ):
+            for handler_name in settings.LOGGING["loggers"][name]["handlers"]:
+                self.assertEqual(
+                    handlers[handler_name]["class"], "app.logging_handlers.BackgroundQueueHandler"
+                )
+
     def test_logging_configuration_present(self):
         """Verify logging configuration is complete."""
         from django.conf import settings
@@ -47,6 +86,64 @@ class SettingsArchitectureTest(TestCase):
         self.assertIn("file_security", settings.LOGGING["handlers"])
         self.assertIn("file_audit", settings.LOGGING["handlers"])
 
+    def test_settings_logging_resolved_once_per_process(self):
+        """Entrypoints and app.settings share one resolved settings-logging context."""
+        from modules.core.settings import setup_settings_logging
+
+        first = setup_settings_logging(logger_name="app.settings_loader.test")
+        self.assertIs(setup_settings_logging(), first)
+
+    def test_settings_logging_explicit_env_is_not_cached(self):
+        """An explicit env mapping is always resolved afresh."""
+        from modules.core.settings import setup_settings_logging
+
+        context = setup_settings_logging(env={"DJANGO_ENV": "production"})
+        self.assertEqual(context.environment, "production")
+        self.assertEqual(context.source, "DJANGO_ENV=production")
+
+    def test_settings_logging_attaches_handlers_once(self):
+        """Repeated setup reuses the settings.log handler and never reaches root handlers."""
+        from modules.core.settings import setup_settings_logging
+
+        for _ in range(3):
+            context = setup_settings_logging(
+                env={"DJANGO_ENV": "production"}, logger_name="app.settings_loader.repeat"
+            )
+        self.assertEqual(len(context.logger.handlers), 1)
+        self.assertFalse(context.logger.propagate)
+
+    def test_settings_reload_does_not_repeat_banner(self):
+        """Re-running the router keeps its settings but logs the banner only once."""
+        import importlib
+        from unittest.mock import patch
+
+        import app.settings as router
+        from django.conf import settings
+
+        with patch.object(router.settings_logger, "info") as info:
+            importlib.reload(router)
+        info.assert_not_called()
+        self.assertEqual(router.INSTALLED_APPS, settings.INSTALLED_APPS)
+
+    def test_router_private_names_stay_out_of_settings(self):
+        """Django copies every isupper() name; the router must not define _UPPER ones."""
+        from django.conf import settings
+
+        settings._setup()
+        leaked = {name for name in settings._wrapped._explicit_settings if name.startswith("_")}
+        self.assertEqual(leaked, set())
+
+    def test_env_snapshot_is_frozen_and_shared(self):
+        """The env snapshot is built once per process and cannot be mutated."""
+        from dataclasses import FrozenInstanceError
+
+        from modules.core.settings import get_env_snapshot
+
+        snapshot = get_env_snapshot()
+        self.assertIs(snapshot, get_env_snapshot())
+        with self.assertRaises(FrozenInstanceError):
+            snapshot.debug = True
+
 
 class DevelopmentSettingsTest(TestCase):
     """Test development settings configuration.
@@ -133,6 +230,26 @@ class DevelopmentSettingsTest(TestCase):
         # Sentry DSN can be set or empty depending on .env
         self.assertIsNotNone(settings.SENTRY_DSN)
 
+    def test_sentry_sdk_not_imported_without_dsn(self):
+        """Without a DSN the settings never pay for importing sentry_sdk."""
+        import os
+        import subprocess
+        import sys
+
+        code = (
+            "import sys, environ\n"
+            "from modules.core.settings import configure_sentry\n"
+            "configure_sentry(environ.Env())\n"
+            "assert 'sentry_sdk' not in sys.modules\n"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code],
+            env={**os.environ, "SENTRY_DSN": ""},
+            capture_output=True,
+            text=True,
+        )
+        self.assertEqual(result.returncode, 0, result.stderr)
+
 
 class ProductionSettingsTest(TestCase):
     """Test production settings configuration.
@@ -151,6 +268,17 @@ class ProductionSettingsTest(TestCase):
         self.assertNotEqual(settings.SECRET_KEY, "")
         self.assertGreater(len(settings.SECRET_KEY), 20)
 
+    def test_production_secret_key_validation(self):
+        """Weak production keys are rejected; valid keys are returned unchanged."""
+        from modules.core.settings import validate_production_secret_key
+
+        for weak_key in (None, "", "django-insecure-" + "x" * 60, "too-short"):
+            with self.assertRaises(ValueError):
+                validate_production_secret_key(weak_key)
+
+        strong_key = "k" * 60
+        self.assertEqual(validate_production_secret_key(strong_key), strong_key)
+
     def test_stripe_keys_present(self):
         """Stripe keys should be configured."""
         from django.conf import settings
@@ -201,6 +329,14 @@ class SecurityHeadersTest(TestCase):
         self.assertEqual(settings.PERMISSIONS_POLICY["camera"], [])
         self.assertEqual(settings.PERMISSIONS_POLICY["microphone"], [])
 
+    def test_header_values_prerendered(self):
+        """Permissions-Policy and CSP header strings are rendered at settings load."""
+        from django.conf import settings
+
+        self.assertIn("geolocation=()", settings.PERMISSIONS_POLICY_HEADER)
+        self.assertTrue(settings.CSP_HEADER.startswith("default-src "))
+        self.assertIn("frame-ancestors 'none'", settings.CSP_HEADER)
+
 
 class JWTConfigurationTest(TestCase):
     """Test JWT configuration."""
@@ -228,6 +364,31 @@ class JWTConfigurationTest(TestCase):
         self.assertIsNotNone(settings.SIMPLE_JWT.get("SIGNING_KEY"))
         self.assertEqual(settings.SIMPLE_JWT["ALGORITHM"], "HS256")
 
+    def test_jwt_key_files_switch_to_eddsa(self):
+        """An Ed25519 key pair from JWT_*_KEY_FILE switches signing to EdDSA."""
+        import os
+        import tempfile
+        from pathlib import Path
+        from unittest import mock
+
+        from modules.core.settings import build_jwt_signing_config
+
+        with tempfile.TemporaryDirectory() as key_dir:
+            private_key = Path(key_dir) / "jwt_ed25519.pem"
+            public_key = Path(key_dir) / "jwt_ed25519.pub"
+            private_key.write_text("private-pem")
+            public_key.write_text("public-pem")
+            key_env = {
+                "JWT_SIGNING_KEY_FILE": str(private_key),
+                "JWT_VERIFYING_KEY_FILE": str(public_key),
+            }
+            with mock.patch.dict(os.environ, key_env):
+                config = build_jwt_signing_config("unused-secret")
+
+        self.assertEqual(config["ALGORITHM"], "EdDSA")
+        self.assertEqual(config["SIGNING_KEY"], "private-pem")
+        self.assertEqual(config["VERIFYING_KEY"], "public-pem")
+
 
 class RESTFrameworkConfigurationTest(TestCase):
     """Test REST Framework configuration."""
@@ -326,7 +487,7 @@ class MiddlewareOrderTest(TestCase):
 
         whitenoise_idx = settings.MIDDLEWARE.index("whitenoise.middleware.WhiteNoiseMiddleware")
         tenant_idx = settings.MIDDLEWARE.index(
-            "django_tenants.middleware.main.TenantMainMiddleware"
+            "app.middleware_tenant_cache.CachedTenantMainMiddleware"
         )
 
         self.assertLess(
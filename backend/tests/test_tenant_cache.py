@@ -0,0 +1,122 @@
+from django.core.cache import cache
+from django.core.cache.backends.base import DEFAULT_TIMEOUT, BaseCache
+from django.test import override_settings
+from modules.tenancy.cache import (
+    get_cached_tenant,
+    invalidate_domain,
+    invalidate_tenant_hosts,
+    remember_domain_hostname,
+)
+
+LOCMEM_CACHES = {"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
+
+
+class _Domain:
+    def __init__(self, tenant):
+        self.tenant = tenant
+
+
+class _DomainManager:
+    def __init__(self, domains):
+        self.domains = domains
+        self.lookups = 0
+
+    def select_related(self, *fields):
+        return self
+
+    def get(self, domain):
+        self.lookups += 1
+        try:
+            return self.domains[domain]
+        except KeyError:
+            raise _DomainModel.DoesNotExist from None
+
+
+class _DomainModel:
+    class DoesNotExist(Exception):
+        pass
+
+    objects = _DomainManager({"acme.localhost": _Domain("acme")})
+
+
+@override_settings(CACHES=LOCMEM_CACHES, TENANT_CACHE_TIMEOUT=60)
+def test_tenant_lookup_is_cached_until_invalidated():
+    _DomainModel.objects.lookups = 0
+
+    assert get_cached_tenant(_DomainModel, "acme.localhost") == "acme"
+    assert get_cached_tenant(_DomainModel, "acme.localhost") == "acme"
+    assert _DomainModel.objects.lookups == 1
+
+    invalidate_tenant_hosts(["acme.localhost"])
+    assert get_cached_tenant(_DomainModel, "acme.localhost") == "acme"
+    assert _DomainModel.objects.lookups == 2
+
+
+@override_settings(CACHES=LOCMEM_CACHES, TENANT_CACHE_TIMEOUT=60)
+def test_unknown_hostname_is_not_cached():
+    _DomainModel.objects.lookups = 0
+
+    for _ in range(2):
+        try:
+            get_cached_tenant(_DomainModel, "missing.localhost")
+        except _DomainModel.DoesNotExist:
+            pass
+    assert _DomainModel.objects.lookups == 2
+
+
+class _UnreachableCache(BaseCache):
+    """Cache backend that fails like RedisCache does when Redis is down."""
+
+    def get(self, key, default=None, version=None):
+        raise ConnectionError("cache unreachable")
+
+    def set(self, key, value, timeout=DEFAULT_TIMEOUT, version=None):
+        raise ConnectionError("cache unreachable")
+
+
+@override_settings(
+    CACHES={"default": {"BACKEND": f"{__name__}._UnreachableCache"}}, TENANT_CACHE_TIMEOUT=60
+)
+def test_tenant_lookup_falls_back_to_database_when_cache_is_down():
+    _DomainModel.objects.lookups = 0
+
+    assert get_cached_tenant(_DomainModel, "acme.localhost") == "acme"
+    assert _DomainModel.objects.lookups == 1
+
+
+class _RenamedDomain:
+    def __init__(self, pk, domain):
+        self.pk = pk
+        self.domain = domain
+
+
+class _StoredDomains:
+    """Stand-in for Domain.objects returning the stored hostname of a pk."""
+
+    def __init__(self, rows):
+        self.rows = rows
+
+    def filter(self, pk):
+        self.pk = pk
+        return self
+
+    def values_list(self, field, flat):
+        return self
+
+    def first(self):
+        return self.rows.get(self.pk)
+
+
+class _DomainSender:
+    objects = _StoredDomains({1: "old.localhost"})
+
+
+@override_settings(CACHES=LOCMEM_CACHES, TENANT_CACHE_TIMEOUT=60)
+def test_domain_rename_invalidates_old_and_new_hostname():
+    cache.set_many({"tenant:host:old.localhost": "acme", "tenant:host:new.localhost": "acme"})
+    domain = _RenamedDomain(1, "new.localhost")
+
+    remember_domain_hostname(_DomainSender, domain)
+    invalidate_domain(_DomainSender, domain)
+
+    assert cache.get_many(["tenant:host:old.localhost", "tenant:host:new.localhost"]) == {}
@@ -142,6 +142,57 @@ class TestTokenRefresh:
         ), f"Expected 401 UNAUTHORIZED for invalid token, got {response.status_code}"
         assert "error" in response.data, "Response should contain error message"
 
+    def test_token_refresh_with_malformed_token_skips_auth_service(self, api_client):
+        """
+        Test structurally invalid tokens are rejected before TenantAuthService runs.
+
+        Verifies:
+        - Garbage tokens return 401 UNAUTHORIZED
+        - No refresh/blacklist work (and so no DB access) is attempted
+        """
+        from unittest.mock import patch
+
+        with patch("api.token_refresh.TenantAuthService.refresh_tokens") as mock_refresh:
+            response = api_client.post(
+                "/api/auth/token/refresh/",
+                {"refresh": "not-a-jwt"},
+                format="json",
+            )
+
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+        mock_refresh.assert_not_called()
+
+    def test_token_refresh_in_flight_for_same_jti_returns_409(
+        self, api_client, test_user_with_tokens
+    ):
+        """
+        Test a refresh racing another refresh of the same token is rejected.
+
+        Verifies:
+        - While the per-JTI lock is held, the refresh returns 409 CONFLICT
+        - TenantAuthService is not called for the duplicate request
+        """
+        from unittest.mock import patch
+
+        from modules.accounts.authentication import acquire_refresh_lock, release_refresh_lock
+
+        _, _, refresh_token = test_user_with_tokens
+        jti = RefreshToken(refresh_token, verify=False)["jti"]
+
+        assert acquire_refresh_lock(jti)
+        try:
+            with patch("api.token_refresh.TenantAuthService.refresh_tokens") as mock_refresh:
+                response = api_client.post(
+                    "/api/auth/token/refresh/",
+                    {"refresh": refresh_token},
+                    format="json",
+                )
+        finally:
+            release_refresh_lock(jti)
+
+        assert response.status_code == status.HTTP_409_CONFLICT
+        mock_refresh.assert_not_called()
+
     def test_token_refresh_with_expired_token_returns_401(self, api_client, test_user_with_tokens):
         """
         Test token refresh with expired token returns 401 Unauthorized.